@@ -1,7 +1,6 @@
 """Map LinkedIn profile data to database models."""
 
 import re
-from datetime import datetime
 from uuid import UUID
 
 from .db_models import (
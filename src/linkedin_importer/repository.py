@@ -1,5 +1,7 @@
 """Database repository for LinkedIn profile import operations."""
 
+import asyncio
+import random
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
@@ -35,11 +37,24 @@ class DatabaseRepository:
         self.config = config
         self._pool: Optional[Pool] = None
 
-    async def connect(self, max_retries: int = 3) -> None:
+    async def connect(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 2.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
+    ) -> None:
         """Establish database connection pool with retry logic.
 
+        Waits between attempts grow exponentially from ``base_delay``, are
+        capped at ``max_delay``, and are stretched by up to ``jitter`` (as a
+        fraction) so that concurrent importers do not retry in lockstep.
+
         Args:
             max_retries: Maximum number of connection attempts
+            base_delay: Delay in seconds before the first retry
+            max_delay: Upper bound in seconds on the un-jittered delay
+            jitter: Maximum random fraction added to each delay; 0 disables it
 
         Raises:
             DatabaseError: If connection fails after all retries
@@ -79,10 +94,9 @@ class DatabaseRepository:
                 last_error = e
                 retry_count += 1
                 if retry_count < max_retries:
-                    # Wait before retry (exponential backoff)
-                    import asyncio
-
-                    await asyncio.sleep(2**retry_count)
+                    # Wait before retry (capped exponential backoff with jitter)
+                    delay = min(max_delay, base_delay * 2 ** (retry_count - 1))
+                    await asyncio.sleep(delay * (1 + random.random() * jitter))
 
         # All retries failed
         error = DatabaseError(
@@ -19,6 +19,44 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Canonical profile URL prefix, and the general pattern for any other form
+_PROFILE_URL_PREFIX = "https://www.linkedin.com/in/"
+_PROFILE_ID_PATTERN = re.compile(r"linkedin\.com/in/([^/]+)/?")
+
+# Date strings LinkedIn uses for a position or education that is still ongoing
+_CURRENT_DATE_MARKERS = frozenset({"present", "current", "now", ""})
+
+_MONTH_NAMES = {
+    "january": 1,
+    "jan": 1,
+    "february": 2,
+    "feb": 2,
+    "march": 3,
+    "mar": 3,
+    "april": 4,
+    "apr": 4,
+    "may": 5,
+    "june": 6,
+    "jun": 6,
+    "july": 7,
+    "jul": 7,
+    "august": 8,
+    "aug": 8,
+    "september": 9,
+    "sep": 9,
+    "sept": 9,
+    "october": 10,
+    "oct": 10,
+    "november": 11,
+    "nov": 11,
+    "december": 12,
+    "dec": 12,
+}
+
+# "Month Year" or "Mon Year", and a bare "Year"
+_MONTH_YEAR_PATTERN = re.compile(r"(\w+)\s+(\d{4})", re.IGNORECASE)
+_YEAR_PATTERN = re.compile(r"^(\d{4})$")
+
 
 def convert_person_to_profile(person: "Person", email: str) -> LinkedInProfile:
     """Convert a linkedin_scraper Person object to a LinkedInProfile.
@@ -88,8 +126,14 @@ def _extract_profile_id(linkedin_url: str) -> str:
     Returns:
         Profile ID/username
     """
-    # Pattern: https://www.linkedin.com/in/username/
-    match = re.search(r"linkedin\.com/in/([^/]+)/?", linkedin_url)
+    # Fast path for the canonical form: https://www.linkedin.com/in/username/
+    if linkedin_url.startswith(_PROFILE_URL_PREFIX):
+        profile_id = linkedin_url[len(_PROFILE_URL_PREFIX) :].partition("/")[0]
+        if profile_id:
+            return profile_id
+
+    # Pattern: [https://][www.]linkedin.com/in/username/
+    match = _PROFILE_ID_PATTERN.search(linkedin_url)
     if match:
         return match.group(1)
 
@@ -141,51 +185,20 @@ def _parse_date(date_str: Optional[str]) -> Optional[date]:
     date_str = date_str.strip()
 
     # Handle "Present" or empty
-    if date_str.lower() in ("present", "current", "now", ""):
+    if date_str.lower() in _CURRENT_DATE_MARKERS:
         return None
 
-    # Try full month name: "January 2020"
-    month_names = {
-        "january": 1,
-        "jan": 1,
-        "february": 2,
-        "feb": 2,
-        "march": 3,
-        "mar": 3,
-        "april": 4,
-        "apr": 4,
-        "may": 5,
-        "june": 6,
-        "jun": 6,
-        "july": 7,
-        "jul": 7,
-        "august": 8,
-        "aug": 8,
-        "september": 9,
-        "sep": 9,
-        "sept": 9,
-        "october": 10,
-        "oct": 10,
-        "november": 11,
-        "nov": 11,
-        "december": 12,
-        "dec": 12,
-    }
-
     # Pattern: "Month Year" or "Mon Year"
-    match = re.match(r"(\w+)\s+(\d{4})", date_str, re.IGNORECASE)
+    match = _MONTH_YEAR_PATTERN.match(date_str)
     if match:
-        month_str = match.group(1).lower()
-        year = int(match.group(2))
-        month = month_names.get(month_str)
+        month = _MONTH_NAMES.get(match.group(1).lower())
         if month:
-            return date(year, month, 1)
+            return date(int(match.group(2)), month, 1)
 
     # Pattern: just year "2020"
-    match = re.match(r"^(\d{4})$", date_str)
+    match = _YEAR_PATTERN.match(date_str)
     if match:
-        year = int(match.group(1))
-        return date(year, 1, 1)
+        return date(int(match.group(1)), 1, 1)
 
     logger.warning("Could not parse date: %s", date_str)
     return None
@@ -231,8 +244,7 @@ def _is_current_position(experience) -> bool:
     if not to_date:
         return True
 
-    to_date_str = str(to_date).lower().strip()
-    return to_date_str in ("present", "current", "now", "")
+    return str(to_date).lower().strip() in _CURRENT_DATE_MARKERS
 
 
 def _convert_education_list(educations: list) -> list[Education]:
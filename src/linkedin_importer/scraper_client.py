@@ -137,7 +137,13 @@ class LinkedInScraperClient:
         screenshot_on_error: bool = False,
         screenshot_dir: Optional[str] = None,
         max_retries: int = 3,
+        runtime: Optional[_PlaywrightRuntime] = None,
     ):
+        """Create the client and start its Playwright runtime.
+
+        Pass an already-started ``runtime`` to reuse it instead of launching a
+        new browser; the client still stops it on close().
+        """
         env_default_headless = True
         self.headless = headless if headless is not None else env_default_headless
         self.user_agent = user_agent
@@ -149,10 +155,12 @@ class LinkedInScraperClient:
         self.max_retries = max_retries
 
         self.authenticated: bool = False
-        self._runtime = _PlaywrightRuntime(
-            headless=self.headless, user_agent=self.user_agent
-        )
-        self._runtime.start()
+        if runtime is None:
+            runtime = _PlaywrightRuntime(
+                headless=self.headless, user_agent=self.user_agent
+            )
+            runtime.start()
+        self._runtime = runtime
 
         logger.debug(
             "LinkedInScraperClient initialized (headless=%s, max_retries=%d)",
@@ -4,10 +4,22 @@ This module defines error classes for handling scraping-specific failures
 when using Selenium and the linkedin_scraper library.
 """
 
+import sys
 from typing import Any, Optional
 
 from .errors import ImportError
 
+# Default messages for errors that are commonly raised without a custom message
+_TWO_FACTOR_REQUIRED_MSG = sys.intern(
+    "Two-factor authentication required. Complete the challenge in the browser and press Enter."
+)
+_COOKIE_EXPIRED_MSG = sys.intern(
+    "LinkedIn session cookie has expired. Please obtain a fresh li_at cookie from LinkedIn."
+)
+_SCRAPING_BLOCKED_MSG = sys.intern(
+    "LinkedIn has blocked this scraping attempt. Try again later or use a different account."
+)
+
 
 class ScraperError(ImportError):
     """Base error for scraping operations."""
@@ -71,7 +83,7 @@ class TwoFactorRequired(ScraperAuthError):
 
     def __init__(
         self,
-        message: str = "Two-factor authentication required. Complete the challenge in the browser and press Enter.",
+        message: Optional[str] = None,
         details: Optional[dict[str, Any]] = None,
     ):
         """Initialize 2FA required error.
@@ -79,7 +91,7 @@ class TwoFactorRequired(ScraperAuthError):
         This error is raised when LinkedIn requires 2FA verification
         during login. The user must complete the verification manually.
         """
-        super().__init__(message, details)
+        super().__init__(message or _TWO_FACTOR_REQUIRED_MSG, details)
         # Override recoverable since user can complete 2FA manually
         self.recoverable = True
 
@@ -93,7 +105,7 @@ class CookieExpired(ScraperAuthError):
 
     def __init__(
         self,
-        message: str = "LinkedIn session cookie has expired. Please obtain a fresh li_at cookie from LinkedIn.",
+        message: Optional[str] = None,
         details: Optional[dict[str, Any]] = None,
     ):
         """Initialize cookie expired error.
@@ -101,7 +113,7 @@ class CookieExpired(ScraperAuthError):
         This error is raised when the li_at cookie is no longer valid
         and the user needs to obtain a fresh cookie.
         """
-        super().__init__(message, details)
+        super().__init__(message or _COOKIE_EXPIRED_MSG, details)
         # Not recoverable - user must manually refresh cookie
         self.recoverable = False
 
@@ -146,7 +158,7 @@ class ScrapingBlocked(ScraperError):
 
     def __init__(
         self,
-        message: str = "LinkedIn has blocked this scraping attempt. Try again later or use a different account.",
+        message: Optional[str] = None,
         details: Optional[dict[str, Any]] = None,
         retry_after: Optional[int] = None,
     ):
@@ -157,6 +169,7 @@ class ScrapingBlocked(ScraperError):
             details: Additional error context
             retry_after: Suggested wait time in seconds before retrying
         """
+        message = message or _SCRAPING_BLOCKED_MSG
         error_details = details or {}
         if retry_after:
             error_details["retry_after_seconds"] = retry_after
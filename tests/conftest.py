@@ -0,0 +1,34 @@
+"""Shared pytest configuration.
+
+The Hypothesis profiles used by the property-based test modules are all
+registered here, so any of them (or Hypothesis's own "default") can be picked
+for the whole run with the HYP_PROFILE environment variable.
+"""
+
+from hypothesis import HealthCheck, Phase, settings
+
+# The adapter helpers are pure and fast: a small example budget is enough,
+# and there is nothing worth replaying from the example database.
+settings.register_profile("adapter_fast", database=None, deadline=None, max_examples=25)
+
+# Scraper property tests only exercise mocks, so skip the on-disk example
+# database.
+settings.register_profile(
+    "scraper_fast",
+    database=None,
+    deadline=None,
+    max_examples=20,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+
+# Validation failures are deterministic for a given input, so a shrunk
+# counterexample adds nothing and there is nothing worth replaying from the
+# example database; derandomize so CI reruns see the same examples.
+settings.register_profile(
+    "validation_fast",
+    database=None,
+    deadline=None,
+    derandomize=True,
+    max_examples=50,
+    phases=[Phase.explicit, Phase.generate],
+)
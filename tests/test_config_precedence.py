@@ -7,6 +7,7 @@ from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from linkedin_importer.cli import load_config
+from linkedin_importer.config import AuthMethod
 
 
 def _call_load_config(**kwargs):
@@ -313,8 +314,6 @@ def test_env_fallback_for_chromedriver_path() -> None:
 # Validates: Requirements 7.1, 7.3
 def test_cookie_auth_method_auto_detected() -> None:
     """When cookie is provided, auth method should be auto-detected as COOKIE."""
-    from linkedin_importer.config import AuthMethod
-
     with patch.dict(
         os.environ,
         {
@@ -336,8 +335,6 @@ def test_cookie_auth_method_auto_detected() -> None:
 # Validates: Requirements 7.1, 7.3
 def test_credentials_auth_method_auto_detected() -> None:
     """When email/password is provided, auth method should be auto-detected as CREDENTIALS."""
-    from linkedin_importer.config import AuthMethod
-
     with patch.dict(
         os.environ,
         {
@@ -360,8 +357,6 @@ def test_credentials_auth_method_auto_detected() -> None:
 # Validates: Requirements 7.1
 def test_cookie_takes_precedence_over_credentials() -> None:
     """When both cookie and credentials are provided, cookie should be used."""
-    from linkedin_importer.config import AuthMethod
-
     with patch.dict(
         os.environ,
         {
@@ -5,7 +5,6 @@ Note: For real PostgreSQL integration testing, set the TEST_DATABASE_URL environ
 """
 
 import os
-from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -197,6 +196,17 @@ def create_mock_pool(
 class TestDatabaseConnection:
     """Tests for database connection handling."""
 
+    @pytest.fixture(autouse=True)
+    def sleep_delays(self, monkeypatch):
+        """Skip retry backoff waits and record the requested delays."""
+        delays = []
+
+        async def _no_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr("linkedin_importer.repository.asyncio.sleep", _no_sleep)
+        return delays
+
     @pytest.mark.asyncio
     async def test_connection_string_from_url(self, db_config):
         """Test connection string generation from URL."""
@@ -245,7 +255,7 @@ class TestDatabaseConnection:
         assert call_count == 2  # Succeeds on second attempt
 
     @pytest.mark.asyncio
-    async def test_connection_max_retries_exceeded(self, db_config):
+    async def test_connection_max_retries_exceeded(self, db_config, sleep_delays):
         """Test that connection fails after max retries exceeded."""
         repo = TransactionalRepository(db_config)
 
@@ -254,7 +264,30 @@ class TestDatabaseConnection:
 
         with patch("asyncpg.create_pool", side_effect=mock_connect):
             with pytest.raises(DatabaseError):
-                await repo.connect(max_retries=3)
+                await repo.connect(max_retries=3, jitter=0)
+
+        assert sleep_delays == [2, 4]  # No wait after the final attempt
+
+    @pytest.mark.asyncio
+    async def test_connection_backoff_is_capped_and_jittered(
+        self, db_config, sleep_delays
+    ):
+        """Test that retry delays stay within the cap plus the jitter fraction."""
+        repo = TransactionalRepository(db_config)
+
+        async def mock_connect(*args, **kwargs):
+            raise Exception("Connection refused")
+
+        with patch("asyncpg.create_pool", side_effect=mock_connect):
+            with pytest.raises(DatabaseError):
+                await repo.connect(
+                    max_retries=6, base_delay=1.0, max_delay=5.0, jitter=0.5
+                )
+
+        expected = [1.0, 2.0, 4.0, 5.0, 5.0]
+        assert len(sleep_delays) == len(expected)
+        for delay, base in zip(sleep_delays, expected):
+            assert base <= delay <= base * 1.5
 
     @pytest.mark.asyncio
     async def test_pool_closed_on_disconnect(self, db_config):
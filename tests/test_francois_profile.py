@@ -5,22 +5,16 @@ with the current importer implementation.
 """
 
 import json
+import uuid
 from datetime import date, datetime
-from pathlib import Path
-
-import pytest
 
 from linkedin_importer.mapper import map_profile_to_database
 from linkedin_importer.models import (
     Certification,
     Education,
-    Honor,
-    Language,
     LinkedInProfile,
     Position,
-    Publication,
     Skill,
-    VolunteerExperience,
 )
 
 
@@ -504,8 +498,6 @@ def generate_database_inspection_data() -> dict:
     ) = map_profile_to_database(profile)
 
     # Simulate UUID generation
-    import uuid
-
     user_id = uuid.uuid4()
 
     # Simulate users table entry
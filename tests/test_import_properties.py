@@ -17,6 +17,7 @@ from linkedin_importer.db_models import ProjectData, UserData
 from linkedin_importer.models import LinkedInProfile
 from linkedin_importer.orchestrator import import_profile
 from linkedin_importer.repository import ImportResult
+from linkedin_importer.scraper_errors import ScraperAuthError, ScraperError
 
 
 # Property 4: Success status completeness
@@ -338,14 +339,10 @@ def test_error_cases_return_proper_result(error_type: str, error_message: str):
         mock_scraper_instance.get_driver_info.return_value = {"chrome_version": "120"}
 
         if error_type == "auth":
-            from linkedin_importer.scraper_errors import ScraperAuthError
-
             mock_scraper_instance.authenticate.side_effect = ScraperAuthError(
                 message=error_message
             )
         elif error_type == "scraper":
-            from linkedin_importer.scraper_errors import ScraperError
-
             mock_scraper_instance.authenticate.return_value = True
             mock_scraper_instance.get_profile.side_effect = ScraperError(
                 message=error_message
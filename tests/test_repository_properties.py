@@ -5,7 +5,7 @@ Validates: Requirements 5.2
 """
 
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 from uuid import uuid4
 
 from hypothesis import given, settings
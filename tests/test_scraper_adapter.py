@@ -4,22 +4,19 @@ Feature: linkedin-scraper, Data Adapter
 Validates: Requirements 4.1, 4.2, 4.3, 4.4, 4.5
 """
 
+import os
 from datetime import date
+from types import SimpleNamespace
 from typing import Optional
-from unittest.mock import MagicMock
 
 import pytest
-from hypothesis import assume, given, settings
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from linkedin_importer.mapper import map_profile_to_database
-from linkedin_importer.models import (
-    Education,
-    LinkedInProfile,
-    Position,
-    Skill,
-)
+from linkedin_importer.models import LinkedInProfile
 from linkedin_importer.scraper_adapter import (
+    _PROFILE_ID_PATTERN,
     _convert_education_list,
     _convert_experiences,
     _extract_profile_id,
@@ -29,6 +26,28 @@ from linkedin_importer.scraper_adapter import (
     convert_person_to_profile,
 )
 
+# Profiles are registered in conftest.py; HYP_PROFILE selects another one.
+_ADAPTER_SETTINGS = settings.get_profile(os.environ.get("HYP_PROFILE", "adapter_fast"))
+
+# Shared strategies. ASCII letters contain no whitespace, and ASCII letters and
+# digits are always alphanumeric, so none of these need a rejection filter.
+_ASCII_LETTERS = st.characters(
+    whitelist_categories=("L",), min_codepoint=65, max_codepoint=122
+)
+_NAME_PARTS = st.text(alphabet=_ASCII_LETTERS, min_size=1, max_size=20)
+_UPPER_NAME_PARTS = st.text(
+    alphabet=st.characters(min_codepoint=65, max_codepoint=90), min_size=1, max_size=10
+)
+_USERNAMES = st.text(
+    alphabet=st.characters(
+        whitelist_categories=("L", "N"), min_codepoint=48, max_codepoint=122
+    ),
+    min_size=3,
+    max_size=20,
+)
+_SKILL_NAMES = st.text(alphabet=_ASCII_LETTERS, min_size=2, max_size=20)
+_YEARS = st.integers(min_value=1950, max_value=2030)
+
 # =============================================================================
 # Unit Tests for _extract_profile_id
 # =============================================================================
@@ -37,40 +56,54 @@ from linkedin_importer.scraper_adapter import (
 class TestExtractProfileId:
     """Unit tests for profile ID extraction from LinkedIn URLs."""
 
-    def test_extract_from_standard_url(self):
-        """Extract profile ID from standard LinkedIn URL."""
-        url = "https://www.linkedin.com/in/john-doe"
-        assert _extract_profile_id(url) == "john-doe"
-
-    def test_extract_from_url_with_trailing_slash(self):
-        """Extract profile ID from URL with trailing slash."""
-        url = "https://www.linkedin.com/in/john-doe/"
-        assert _extract_profile_id(url) == "john-doe"
-
-    def test_extract_from_url_without_www(self):
-        """Extract profile ID from URL without www."""
-        url = "https://linkedin.com/in/jane-smith"
-        assert _extract_profile_id(url) == "jane-smith"
-
-    def test_extract_from_url_with_query_params(self):
-        """Extract profile ID from URL with query parameters."""
-        url = "https://www.linkedin.com/in/john-doe/?originalSubdomain=ca"
-        # The regex captures up to ? or /
-        result = _extract_profile_id(url)
-        # Should get john-doe (the regex stops at /)
-        assert "john-doe" in result
-
-    def test_fallback_for_non_matching_url(self):
-        """Fallback to last path segment for non-matching URLs."""
-        url = "https://example.com/profiles/johndoe"
-        assert _extract_profile_id(url) == "johndoe"
-
-    def test_handle_empty_url(self):
-        """Handle empty URL gracefully."""
-        url = ""
-        result = _extract_profile_id(url)
-        # Should return empty or last segment
-        assert result == ""
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param(
+                "https://www.linkedin.com/in/john-doe", "john-doe", id="standard"
+            ),
+            pytest.param(
+                "https://www.linkedin.com/in/john-doe/", "john-doe", id="trailing-slash"
+            ),
+            pytest.param(
+                "https://linkedin.com/in/jane-smith", "jane-smith", id="without-www"
+            ),
+            pytest.param(
+                "https://www.linkedin.com/in/john-doe/?originalSubdomain=ca",
+                "john-doe",
+                id="query-params",
+            ),
+            pytest.param(
+                "https://example.com/profiles/johndoe", "johndoe", id="fallback"
+            ),
+            pytest.param("", "", id="empty"),
+        ],
+    )
+    def test_extract_profile_id(self, url, expected):
+        """Extract the profile ID, falling back to the last path segment."""
+        assert _extract_profile_id(url) == expected
+
+
+@settings(_ADAPTER_SETTINGS)
+@given(
+    prefix=st.sampled_from(
+        ["https://www.linkedin.com/in/", "https://linkedin.com/in/", "linkedin.com/in/"]
+    ),
+    profile_id=st.text(
+        alphabet=st.characters(blacklist_characters="/"), min_size=1, max_size=30
+    ),
+    suffix=st.sampled_from(["", "/", "/?originalSubdomain=ca", "/details/skills/"]),
+)
+def test_property_profile_id_fast_path_matches_pattern(
+    prefix: str, profile_id: str, suffix: str
+):
+    """
+    Property: The canonical-URL fast path agrees with the general pattern.
+    Validates: Requirement 4.1
+    """
+    url = f"{prefix}{profile_id}{suffix}"
+
+    assert _extract_profile_id(url) == _PROFILE_ID_PATTERN.search(url).group(1)
 
 
 # =============================================================================
@@ -81,47 +114,25 @@ class TestExtractProfileId:
 class TestParseName:
     """Unit tests for name parsing."""
 
-    def test_parse_full_name(self):
-        """Parse a standard first and last name."""
-        first, last = _parse_name("John Doe")
-        assert first == "John"
-        assert last == "Doe"
-
-    def test_parse_single_name(self):
-        """Parse a single name (first name only)."""
-        first, last = _parse_name("Madonna")
-        assert first == "Madonna"
-        assert last == ""
-
-    def test_parse_multiple_names(self):
-        """Parse name with multiple parts (middle names)."""
-        first, last = _parse_name("John Paul Jones Smith")
-        assert first == "John"
-        assert last == "Paul Jones Smith"
-
-    def test_parse_empty_string(self):
-        """Parse empty string returns empty tuple."""
-        first, last = _parse_name("")
-        assert first == ""
-        assert last == ""
-
-    def test_parse_none(self):
-        """Parse None returns empty tuple."""
-        first, last = _parse_name(None)
-        assert first == ""
-        assert last == ""
-
-    def test_parse_whitespace_only(self):
-        """Parse whitespace-only string returns empty tuple."""
-        first, last = _parse_name("   ")
-        assert first == ""
-        assert last == ""
-
-    def test_parse_name_with_extra_spaces(self):
-        """Parse name with extra whitespace."""
-        first, last = _parse_name("  John   Doe  ")
-        assert first == "John"
-        assert last == "Doe"
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            pytest.param("John Doe", ("John", "Doe"), id="full-name"),
+            pytest.param("Madonna", ("Madonna", ""), id="single-name"),
+            pytest.param(
+                "John Paul Jones Smith",
+                ("John", "Paul Jones Smith"),
+                id="multiple-names",
+            ),
+            pytest.param("", ("", ""), id="empty-string"),
+            pytest.param(None, ("", ""), id="none"),
+            pytest.param("   ", ("", ""), id="whitespace-only"),
+            pytest.param("  John   Doe  ", ("John", "Doe"), id="extra-spaces"),
+        ],
+    )
+    def test_parse_name(self, name, expected):
+        """Split into first name and the remaining parts as last name."""
+        assert _parse_name(name) == expected
 
 
 # =============================================================================
@@ -129,22 +140,10 @@ class TestParseName:
 # =============================================================================
 
 
-@settings(max_examples=100, deadline=None)
+@settings(_ADAPTER_SETTINGS)
 @given(
-    first=st.text(
-        alphabet=st.characters(
-            whitelist_categories=("L",), min_codepoint=65, max_codepoint=122
-        ),
-        min_size=1,
-        max_size=20,
-    ).filter(lambda x: x.strip()),
-    last=st.text(
-        alphabet=st.characters(
-            whitelist_categories=("L",), min_codepoint=65, max_codepoint=122
-        ),
-        min_size=1,
-        max_size=20,
-    ).filter(lambda x: x.strip()),
+    first=_NAME_PARTS,
+    last=_NAME_PARTS,
 )
 def test_property_name_split_correctly(first: str, last: str):
     """
@@ -161,15 +160,9 @@ def test_property_name_split_correctly(first: str, last: str):
     assert parsed_last == last
 
 
-@settings(max_examples=50, deadline=None)
+@settings(_ADAPTER_SETTINGS)
 @given(
-    name=st.text(
-        alphabet=st.characters(
-            whitelist_categories=("L",), min_codepoint=65, max_codepoint=122
-        ),
-        min_size=1,
-        max_size=20,
-    ).filter(lambda x: x.strip() and " " not in x),
+    name=_NAME_PARTS,
 )
 def test_property_single_name_first_only(name: str):
     """
@@ -182,10 +175,7 @@ def test_property_single_name_first_only(name: str):
     assert parsed_last == ""
 
 
-@settings(max_examples=50, deadline=None)
-@given(
-    empty_ish=st.sampled_from(["", "   ", "\t", "\n", None]),
-)
+@pytest.mark.parametrize("empty_ish", ["", "   ", "\t", "\n", None])
 def test_property_empty_names_return_empty_tuple(empty_ish):
     """
     Property: Empty/None names return empty strings.
@@ -202,109 +192,74 @@ def test_property_empty_names_return_empty_tuple(empty_ish):
 # =============================================================================
 
 
+_ABBREVIATED_MONTHS = [
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+]
+_FULL_MONTHS = [
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+
+
 class TestParseDate:
     """Unit tests for date parsing."""
 
-    def test_parse_abbreviated_month_year(self):
-        """Parse 'Jan 2023' format."""
-        result = _parse_date("Jan 2023")
-        assert result == date(2023, 1, 1)
-
-    def test_parse_full_month_year(self):
-        """Parse 'January 2023' format."""
-        result = _parse_date("January 2023")
-        assert result == date(2023, 1, 1)
-
-    def test_parse_year_only(self):
-        """Parse year-only format '2023'."""
-        result = _parse_date("2023")
-        assert result == date(2023, 1, 1)
-
-    def test_parse_present(self):
-        """Parse 'Present' returns None (current position)."""
-        result = _parse_date("Present")
-        assert result is None
-
-    def test_parse_current(self):
-        """Parse 'Current' returns None."""
-        result = _parse_date("Current")
-        assert result is None
-
-    def test_parse_now(self):
-        """Parse 'Now' returns None."""
-        result = _parse_date("Now")
-        assert result is None
-
-    def test_parse_empty_string(self):
-        """Parse empty string returns None."""
-        result = _parse_date("")
-        assert result is None
-
-    def test_parse_none(self):
-        """Parse None returns None."""
-        result = _parse_date(None)
-        assert result is None
-
-    def test_parse_all_months_abbreviated(self):
-        """Parse all abbreviated month names."""
-        months = [
-            "Jan",
-            "Feb",
-            "Mar",
-            "Apr",
-            "May",
-            "Jun",
-            "Jul",
-            "Aug",
-            "Sep",
-            "Oct",
-            "Nov",
-            "Dec",
-        ]
-        for i, month in enumerate(months, 1):
-            result = _parse_date(f"{month} 2020")
-            assert result == date(2020, i, 1), f"Failed for {month}"
-
-    def test_parse_all_months_full(self):
-        """Parse all full month names."""
-        months = [
-            "January",
-            "February",
-            "March",
-            "April",
-            "May",
-            "June",
-            "July",
-            "August",
-            "September",
-            "October",
-            "November",
-            "December",
-        ]
-        for i, month in enumerate(months, 1):
-            result = _parse_date(f"{month} 2020")
-            assert result == date(2020, i, 1), f"Failed for {month}"
-
-    def test_parse_case_insensitive(self):
-        """Parse is case insensitive."""
-        assert _parse_date("JANUARY 2020") == date(2020, 1, 1)
-        assert _parse_date("january 2020") == date(2020, 1, 1)
-        assert _parse_date("JAN 2020") == date(2020, 1, 1)
-
-    def test_parse_invalid_format_returns_none(self):
-        """Invalid date format returns None."""
-        result = _parse_date("Invalid Date")
-        assert result is None
-
-    def test_parse_with_extra_whitespace(self):
-        """Parse handles extra whitespace."""
-        result = _parse_date("  Jan 2023  ")
-        assert result == date(2023, 1, 1)
-
-    def test_parse_september_short_forms(self):
-        """Parse both Sep and Sept abbreviations."""
-        assert _parse_date("Sep 2020") == date(2020, 9, 1)
-        assert _parse_date("Sept 2020") == date(2020, 9, 1)
+    @pytest.mark.parametrize(
+        "date_str,expected",
+        [
+            pytest.param("Jan 2023", date(2023, 1, 1), id="abbreviated-month-year"),
+            pytest.param("January 2023", date(2023, 1, 1), id="full-month-year"),
+            pytest.param("2023", date(2023, 1, 1), id="year-only"),
+            pytest.param("Present", None, id="present"),
+            pytest.param("Current", None, id="current"),
+            pytest.param("Now", None, id="now"),
+            pytest.param("", None, id="empty-string"),
+            pytest.param(None, None, id="none"),
+            pytest.param("JANUARY 2020", date(2020, 1, 1), id="upper-full"),
+            pytest.param("january 2020", date(2020, 1, 1), id="lower-full"),
+            pytest.param("JAN 2020", date(2020, 1, 1), id="upper-abbreviated"),
+            pytest.param("Invalid Date", None, id="invalid-format"),
+            pytest.param("  Jan 2023  ", date(2023, 1, 1), id="extra-whitespace"),
+            pytest.param("Sep 2020", date(2020, 9, 1), id="sep"),
+            pytest.param("Sept 2020", date(2020, 9, 1), id="sept"),
+        ],
+    )
+    def test_parse_date(self, date_str, expected):
+        """Parse month/year and year-only strings; current markers give None."""
+        assert _parse_date(date_str) == expected
+
+    @pytest.mark.parametrize(
+        "month,number",
+        [
+            pytest.param(month, number, id=month)
+            for months in (_ABBREVIATED_MONTHS, _FULL_MONTHS)
+            for number, month in enumerate(months, 1)
+        ],
+    )
+    def test_parse_every_month_name(self, month, number):
+        """Parse every abbreviated and full month name."""
+        assert _parse_date(f"{month} 2020") == date(2020, number, 1)
 
 
 # =============================================================================
@@ -312,25 +267,10 @@ class TestParseDate:
 # =============================================================================
 
 
-@settings(max_examples=100, deadline=None)
+@settings(_ADAPTER_SETTINGS)
 @given(
-    month=st.sampled_from(
-        [
-            "Jan",
-            "Feb",
-            "Mar",
-            "Apr",
-            "May",
-            "Jun",
-            "Jul",
-            "Aug",
-            "Sep",
-            "Oct",
-            "Nov",
-            "Dec",
-        ]
-    ),
-    year=st.integers(min_value=1950, max_value=2030),
+    month=st.sampled_from(_ABBREVIATED_MONTHS),
+    year=_YEARS,
 )
 def test_property_abbreviated_month_year_parsed(month: str, year: int):
     """
@@ -345,25 +285,10 @@ def test_property_abbreviated_month_year_parsed(month: str, year: int):
     assert result.day == 1
 
 
-@settings(max_examples=100, deadline=None)
+@settings(_ADAPTER_SETTINGS)
 @given(
-    month=st.sampled_from(
-        [
-            "January",
-            "February",
-            "March",
-            "April",
-            "May",
-            "June",
-            "July",
-            "August",
-            "September",
-            "October",
-            "November",
-            "December",
-        ]
-    ),
-    year=st.integers(min_value=1950, max_value=2030),
+    month=st.sampled_from(_FULL_MONTHS),
+    year=_YEARS,
 )
 def test_property_full_month_year_parsed(month: str, year: int):
     """
@@ -378,8 +303,8 @@ def test_property_full_month_year_parsed(month: str, year: int):
     assert result.day == 1
 
 
-@settings(max_examples=50, deadline=None)
-@given(year=st.integers(min_value=1950, max_value=2030))
+@settings(_ADAPTER_SETTINGS)
+@given(year=_YEARS)
 def test_property_year_only_parsed(year: int):
     """
     Property: Year-only format is correctly parsed to January 1st.
@@ -394,11 +319,9 @@ def test_property_year_only_parsed(year: int):
     assert result.day == 1
 
 
-@settings(max_examples=20, deadline=None)
-@given(
-    present_variant=st.sampled_from(
-        ["Present", "present", "PRESENT", "Current", "current", "Now", "now"]
-    ),
+@pytest.mark.parametrize(
+    "present_variant",
+    ["Present", "present", "PRESENT", "Current", "current", "Now", "now"],
 )
 def test_property_present_returns_none(present_variant: str):
     """
@@ -429,13 +352,14 @@ class TestConvertExperiences:
 
     def test_convert_single_experience(self):
         """Convert a single experience."""
-        exp = MagicMock()
-        exp.institution_name = "Acme Corp"
-        exp.position_title = "Software Engineer"
-        exp.description = "Built amazing things"
-        exp.location = "San Francisco, CA"
-        exp.from_date = "Jan 2020"
-        exp.to_date = "Dec 2022"
+        exp = SimpleNamespace(
+            institution_name="Acme Corp",
+            position_title="Software Engineer",
+            description="Built amazing things",
+            location="San Francisco, CA",
+            from_date="Jan 2020",
+            to_date="Dec 2022",
+        )
 
         result = _convert_experiences([exp])
 
@@ -450,13 +374,14 @@ class TestConvertExperiences:
 
     def test_convert_experience_with_present(self):
         """Convert experience with 'Present' end date."""
-        exp = MagicMock()
-        exp.institution_name = "Current Company"
-        exp.position_title = "Lead Developer"
-        exp.description = "Leading development"
-        exp.location = "Remote"
-        exp.from_date = "Jun 2023"
-        exp.to_date = "Present"
+        exp = SimpleNamespace(
+            institution_name="Current Company",
+            position_title="Lead Developer",
+            description="Leading development",
+            location="Remote",
+            from_date="Jun 2023",
+            to_date="Present",
+        )
 
         result = _convert_experiences([exp])
 
@@ -466,13 +391,14 @@ class TestConvertExperiences:
 
     def test_convert_experience_with_missing_fields(self):
         """Convert experience with missing optional fields."""
-        exp = MagicMock()
-        exp.institution_name = "Company"
-        exp.position_title = "Title"
-        exp.description = None
-        exp.location = None
-        exp.from_date = None
-        exp.to_date = None
+        exp = SimpleNamespace(
+            institution_name="Company",
+            position_title="Title",
+            description=None,
+            location=None,
+            from_date=None,
+            to_date=None,
+        )
 
         result = _convert_experiences([exp])
 
@@ -506,12 +432,13 @@ class TestConvertEducationList:
 
     def test_convert_single_education(self):
         """Convert a single education entry."""
-        edu = MagicMock()
-        edu.institution_name = "MIT"
-        edu.degree = "Bachelor of Science in Computer Science"
-        edu.description = "Focus on AI and ML"
-        edu.from_date = "Sep 2015"
-        edu.to_date = "May 2019"
+        edu = SimpleNamespace(
+            institution_name="MIT",
+            degree="Bachelor of Science in Computer Science",
+            description="Focus on AI and ML",
+            from_date="Sep 2015",
+            to_date="May 2019",
+        )
 
         result = _convert_education_list([edu])
 
@@ -525,12 +452,13 @@ class TestConvertEducationList:
 
     def test_convert_education_with_missing_fields(self):
         """Convert education with missing optional fields."""
-        edu = MagicMock()
-        edu.institution_name = "University"
-        edu.degree = None
-        edu.description = None
-        edu.from_date = None
-        edu.to_date = None
+        edu = SimpleNamespace(
+            institution_name="University",
+            degree=None,
+            description=None,
+            from_date=None,
+            to_date=None,
+        )
 
         result = _convert_education_list([edu])
 
@@ -551,9 +479,7 @@ class TestExtractSkills:
 
     def test_extract_from_skills_list_strings(self):
         """Extract skills from a list of strings."""
-        person = MagicMock()
-        person.skills = ["Python", "JavaScript", "React"]
-        person.interests = []
+        person = SimpleNamespace(skills=["Python", "JavaScript", "React"], interests=[])
 
         result = _extract_skills(person)
 
@@ -564,14 +490,10 @@ class TestExtractSkills:
 
     def test_extract_from_skills_list_objects(self):
         """Extract skills from a list of objects with name attribute."""
-        skill1 = MagicMock()
-        skill1.name = "Python"
-        skill2 = MagicMock()
-        skill2.name = "JavaScript"
+        skill1 = SimpleNamespace(name="Python")
+        skill2 = SimpleNamespace(name="JavaScript")
 
-        person = MagicMock()
-        person.skills = [skill1, skill2]
-        person.interests = []
+        person = SimpleNamespace(skills=[skill1, skill2], interests=[])
 
         result = _extract_skills(person)
 
@@ -581,9 +503,9 @@ class TestExtractSkills:
 
     def test_extract_from_interests(self):
         """Extract skills from interests list."""
-        person = MagicMock()
-        person.skills = []
-        person.interests = ["Machine Learning", "Cloud Computing"]
+        person = SimpleNamespace(
+            skills=[], interests=["Machine Learning", "Cloud Computing"]
+        )
 
         result = _extract_skills(person)
 
@@ -593,9 +515,10 @@ class TestExtractSkills:
 
     def test_combine_skills_and_interests(self):
         """Combine skills and interests, deduplicating."""
-        person = MagicMock()
-        person.skills = ["Python", "JavaScript"]
-        person.interests = ["Python", "AI"]  # Python is duplicate
+        person = SimpleNamespace(
+            skills=["Python", "JavaScript"],
+            interests=["Python", "AI"],  # Python is duplicate
+        )
 
         result = _extract_skills(person)
 
@@ -607,9 +530,7 @@ class TestExtractSkills:
 
     def test_extract_empty_skills(self):
         """Extract from empty skills and interests."""
-        person = MagicMock()
-        person.skills = []
-        person.interests = []
+        person = SimpleNamespace(skills=[], interests=[])
 
         result = _extract_skills(person)
 
@@ -617,9 +538,7 @@ class TestExtractSkills:
 
     def test_extract_none_skills(self):
         """Handle None skills and interests."""
-        person = MagicMock()
-        person.skills = None
-        person.interests = None
+        person = SimpleNamespace(skills=None, interests=None)
 
         result = _extract_skills(person)
 
@@ -627,9 +546,9 @@ class TestExtractSkills:
 
     def test_filter_empty_skill_names(self):
         """Filter out empty skill names."""
-        person = MagicMock()
-        person.skills = ["Python", "", "  ", "JavaScript"]
-        person.interests = []
+        person = SimpleNamespace(
+            skills=["Python", "", "  ", "JavaScript"], interests=[]
+        )
 
         result = _extract_skills(person)
 
@@ -651,33 +570,36 @@ class TestConvertPersonToProfile:
     def test_convert_complete_person(self):
         """Convert a fully populated Person object."""
         # Create mock experiences
-        exp = MagicMock()
-        exp.institution_name = "Tech Corp"
-        exp.position_title = "Senior Developer"
-        exp.description = "Led a team of 5"
-        exp.location = "NYC"
-        exp.from_date = "Jan 2020"
-        exp.to_date = "Present"
+        exp = SimpleNamespace(
+            institution_name="Tech Corp",
+            position_title="Senior Developer",
+            description="Led a team of 5",
+            location="NYC",
+            from_date="Jan 2020",
+            to_date="Present",
+        )
 
         # Create mock education
-        edu = MagicMock()
-        edu.institution_name = "Stanford University"
-        edu.degree = "M.S. Computer Science"
-        edu.description = None
-        edu.from_date = "Sep 2016"
-        edu.to_date = "Jun 2018"
+        edu = SimpleNamespace(
+            institution_name="Stanford University",
+            degree="M.S. Computer Science",
+            description=None,
+            from_date="Sep 2016",
+            to_date="Jun 2018",
+        )
 
         # Create mock person
-        person = MagicMock()
-        person.name = "John Doe"
-        person.linkedin_url = "https://www.linkedin.com/in/johndoe"
-        person.job_title = "Senior Developer at Tech Corp"
-        person.about = "Passionate developer with 10+ years experience"
-        person.location = "New York, NY"
-        person.experiences = [exp]
-        person.educations = [edu]
-        person.skills = ["Python", "Go", "Kubernetes"]
-        person.interests = []
+        person = SimpleNamespace(
+            name="John Doe",
+            linkedin_url="https://www.linkedin.com/in/johndoe",
+            job_title="Senior Developer at Tech Corp",
+            about="Passionate developer with 10+ years experience",
+            location="New York, NY",
+            experiences=[exp],
+            educations=[edu],
+            skills=["Python", "Go", "Kubernetes"],
+            interests=[],
+        )
 
         result = convert_person_to_profile(person, "john@example.com")
 
@@ -704,16 +626,17 @@ class TestConvertPersonToProfile:
 
     def test_convert_minimal_person(self):
         """Convert a Person with minimal data."""
-        person = MagicMock()
-        person.name = "Jane"
-        person.linkedin_url = "https://linkedin.com/in/jane"
-        person.job_title = None
-        person.about = None
-        person.location = None
-        person.experiences = []
-        person.educations = []
-        person.skills = []
-        person.interests = []
+        person = SimpleNamespace(
+            name="Jane",
+            linkedin_url="https://linkedin.com/in/jane",
+            job_title=None,
+            about=None,
+            location=None,
+            experiences=[],
+            educations=[],
+            skills=[],
+            interests=[],
+        )
 
         result = convert_person_to_profile(person, "jane@example.com")
 
@@ -729,16 +652,17 @@ class TestConvertPersonToProfile:
 
     def test_convert_person_with_no_name(self):
         """Convert a Person with no name."""
-        person = MagicMock()
-        person.name = None
-        person.linkedin_url = "https://linkedin.com/in/unknown"
-        person.job_title = "Developer"
-        person.about = "About me"
-        person.location = None
-        person.experiences = []
-        person.educations = []
-        person.skills = []
-        person.interests = []
+        person = SimpleNamespace(
+            name=None,
+            linkedin_url="https://linkedin.com/in/unknown",
+            job_title="Developer",
+            about="About me",
+            location=None,
+            experiences=[],
+            educations=[],
+            skills=[],
+            interests=[],
+        )
 
         result = convert_person_to_profile(person, "unknown@example.com")
 
@@ -762,41 +686,45 @@ class TestAdapterMapperIntegration:
         This test verifies the complete flow from Person → LinkedInProfile → Database models.
         """
         # Create a realistic mock Person
-        exp1 = MagicMock()
-        exp1.institution_name = "Google"
-        exp1.position_title = "Software Engineer"
-        exp1.description = "Worked on Search infrastructure"
-        exp1.location = "Mountain View, CA"
-        exp1.from_date = "Jun 2018"
-        exp1.to_date = "Present"
-
-        exp2 = MagicMock()
-        exp2.institution_name = "Facebook"
-        exp2.position_title = "Junior Developer"
-        exp2.description = "Built features for Messenger"
-        exp2.location = "Menlo Park, CA"
-        exp2.from_date = "Jan 2016"
-        exp2.to_date = "May 2018"
-
-        edu = MagicMock()
-        edu.institution_name = "UC Berkeley"
-        edu.degree = "B.S. Computer Science"
-        edu.description = "Graduated with honors"
-        edu.from_date = "Aug 2012"
-        edu.to_date = "May 2016"
-
-        person = MagicMock()
-        person.name = "Alex Johnson"
-        person.linkedin_url = "https://www.linkedin.com/in/alexjohnson"
-        person.job_title = "Software Engineer at Google"
-        person.about = (
-            "Experienced software engineer passionate about building scalable systems."
+        exp1 = SimpleNamespace(
+            institution_name="Google",
+            position_title="Software Engineer",
+            description="Worked on Search infrastructure",
+            location="Mountain View, CA",
+            from_date="Jun 2018",
+            to_date="Present",
+        )
+
+        exp2 = SimpleNamespace(
+            institution_name="Facebook",
+            position_title="Junior Developer",
+            description="Built features for Messenger",
+            location="Menlo Park, CA",
+            from_date="Jan 2016",
+            to_date="May 2018",
+        )
+
+        edu = SimpleNamespace(
+            institution_name="UC Berkeley",
+            degree="B.S. Computer Science",
+            description="Graduated with honors",
+            from_date="Aug 2012",
+            to_date="May 2016",
+        )
+
+        person = SimpleNamespace(
+            name="Alex Johnson",
+            linkedin_url="https://www.linkedin.com/in/alexjohnson",
+            job_title="Software Engineer at Google",
+            about=(
+                "Experienced software engineer passionate about building scalable systems."
+            ),
+            location="San Francisco Bay Area",
+            experiences=[exp1, exp2],
+            educations=[edu],
+            skills=["Python", "Java", "Distributed Systems", "Kubernetes"],
+            interests=["Open Source", "Machine Learning"],
         )
-        person.location = "San Francisco Bay Area"
-        person.experiences = [exp1, exp2]
-        person.educations = [edu]
-        person.skills = ["Python", "Java", "Distributed Systems", "Kubernetes"]
-        person.interests = ["Open Source", "Machine Learning"]
 
         # Convert Person to LinkedInProfile using the adapter
         profile = convert_person_to_profile(person, "alex.johnson@email.com")
@@ -845,16 +773,17 @@ class TestAdapterMapperIntegration:
         Integration test: Empty profile still works with mapper.
         Validates: Requirement 4.5
         """
-        person = MagicMock()
-        person.name = "Empty Profile"
-        person.linkedin_url = "https://linkedin.com/in/empty"
-        person.job_title = None
-        person.about = None
-        person.location = None
-        person.experiences = []
-        person.educations = []
-        person.skills = []
-        person.interests = []
+        person = SimpleNamespace(
+            name="Empty Profile",
+            linkedin_url="https://linkedin.com/in/empty",
+            job_title=None,
+            about=None,
+            location=None,
+            experiences=[],
+            educations=[],
+            skills=[],
+            interests=[],
+        )
 
         profile = convert_person_to_profile(person, "empty@example.com")
 
@@ -879,16 +808,17 @@ class TestAdapterMapperIntegration:
         Integration test: Profile with special characters in names.
         Validates: Requirement 4.1
         """
-        person = MagicMock()
-        person.name = "José García-López"
-        person.linkedin_url = "https://linkedin.com/in/jose-garcia"
-        person.job_title = "Développeur Senior"
-        person.about = "Développement de logiciels pour l'industrie"
-        person.location = "Paris, France"
-        person.experiences = []
-        person.educations = []
-        person.skills = ["C++", "Python"]
-        person.interests = []
+        person = SimpleNamespace(
+            name="José García-López",
+            linkedin_url="https://linkedin.com/in/jose-garcia",
+            job_title="Développeur Senior",
+            about="Développement de logiciels pour l'industrie",
+            location="Paris, France",
+            experiences=[],
+            educations=[],
+            skills=["C++", "Python"],
+            interests=[],
+        )
 
         profile = convert_person_to_profile(person, "jose@example.com")
 
@@ -924,44 +854,27 @@ def _create_mock_person(
     educations: Optional[list] = None,
     skills: Optional[list] = None,
     interests: Optional[list] = None,
-) -> MagicMock:
+) -> SimpleNamespace:
     """Helper to create mock Person objects."""
-    person = MagicMock()
-    person.name = name
-    person.linkedin_url = url
-    person.job_title = job_title
-    person.about = about
-    person.location = location
-    person.experiences = experiences or []
-    person.educations = educations or []
-    person.skills = skills or []
-    person.interests = interests or []
+    person = SimpleNamespace(
+        name=name,
+        linkedin_url=url,
+        job_title=job_title,
+        about=about,
+        location=location,
+        experiences=experiences or [],
+        educations=educations or [],
+        skills=skills or [],
+        interests=interests or [],
+    )
     return person
 
 
-@settings(max_examples=50, deadline=None)
+@settings(_ADAPTER_SETTINGS)
 @given(
-    first=st.text(
-        alphabet=st.characters(
-            whitelist_categories=("L",), min_codepoint=65, max_codepoint=122
-        ),
-        min_size=1,
-        max_size=15,
-    ).filter(lambda x: x.strip()),
-    last=st.text(
-        alphabet=st.characters(
-            whitelist_categories=("L",), min_codepoint=65, max_codepoint=122
-        ),
-        min_size=1,
-        max_size=15,
-    ).filter(lambda x: x.strip()),
-    username=st.text(
-        alphabet=st.characters(
-            whitelist_categories=("L", "N"), min_codepoint=48, max_codepoint=122
-        ),
-        min_size=3,
-        max_size=20,
-    ).filter(lambda x: x.strip() and x.isalnum()),
+    first=_NAME_PARTS,
+    last=_NAME_PARTS,
+    username=_USERNAMES,
     email=st.emails(),
 )
 def test_property_conversion_preserves_identity(
@@ -983,11 +896,32 @@ def test_property_conversion_preserves_identity(
     assert profile.profile_id == username
 
 
-@settings(max_examples=30, deadline=None)
-@given(
-    num_experiences=st.integers(min_value=0, max_value=5),
-    num_educations=st.integers(min_value=0, max_value=3),
+# Built once and sliced per example; the adapter only reads these entries.
+_EXPERIENCE_POOL = tuple(
+    SimpleNamespace(
+        institution_name=f"Company{i}",
+        position_title=f"Title{i}",
+        description=None,
+        location=None,
+        from_date=None,
+        to_date=None,
+    )
+    for i in range(5)
+)
+_EDUCATION_POOL = tuple(
+    SimpleNamespace(
+        institution_name=f"School{i}",
+        degree=f"Degree{i}",
+        description=None,
+        from_date=None,
+        to_date=None,
+    )
+    for i in range(3)
 )
+
+
+@pytest.mark.parametrize("num_educations", range(len(_EDUCATION_POOL) + 1))
+@pytest.mark.parametrize("num_experiences", range(len(_EXPERIENCE_POOL) + 1))
 def test_property_conversion_preserves_counts(
     num_experiences: int, num_educations: int
 ):
@@ -995,26 +929,8 @@ def test_property_conversion_preserves_counts(
     Property: Conversion preserves the count of experiences and educations.
     Validates: Requirements 4.2, 4.3
     """
-    experiences = []
-    for i in range(num_experiences):
-        exp = MagicMock()
-        exp.institution_name = f"Company{i}"
-        exp.position_title = f"Title{i}"
-        exp.description = None
-        exp.location = None
-        exp.from_date = None
-        exp.to_date = None
-        experiences.append(exp)
-
-    educations = []
-    for i in range(num_educations):
-        edu = MagicMock()
-        edu.institution_name = f"School{i}"
-        edu.degree = f"Degree{i}"
-        edu.description = None
-        edu.from_date = None
-        edu.to_date = None
-        educations.append(edu)
+    experiences = list(_EXPERIENCE_POOL[:num_experiences])
+    educations = list(_EDUCATION_POOL[:num_educations])
 
     person = _create_mock_person(
         name="Test User",
@@ -1029,20 +945,9 @@ def test_property_conversion_preserves_counts(
     assert len(profile.education) == num_educations
 
 
-@settings(max_examples=30, deadline=None)
+@settings(_ADAPTER_SETTINGS)
 @given(
-    skills=st.lists(
-        st.text(
-            alphabet=st.characters(
-                whitelist_categories=("L",), min_codepoint=65, max_codepoint=122
-            ),
-            min_size=2,
-            max_size=20,
-        ).filter(lambda x: x.strip()),
-        min_size=0,
-        max_size=10,
-        unique=True,
-    ),
+    skills=st.lists(_SKILL_NAMES, min_size=0, max_size=10, unique=True),
 )
 def test_property_skills_preserved(skills: list):
     """
@@ -1063,22 +968,10 @@ def test_property_skills_preserved(skills: list):
     assert profile_skill_names == input_skill_names
 
 
-@settings(max_examples=20, deadline=None)
+@settings(_ADAPTER_SETTINGS, max_examples=20)
 @given(
-    first=st.text(
-        alphabet=st.characters(
-            whitelist_categories=("L",), min_codepoint=65, max_codepoint=90
-        ),
-        min_size=1,
-        max_size=10,
-    ).filter(lambda x: x.strip()),
-    last=st.text(
-        alphabet=st.characters(
-            whitelist_categories=("L",), min_codepoint=65, max_codepoint=90
-        ),
-        min_size=1,
-        max_size=10,
-    ).filter(lambda x: x.strip()),
+    first=_UPPER_NAME_PARTS,
+    last=_UPPER_NAME_PARTS,
 )
 def test_property_converted_profile_works_with_mapper(first: str, last: str):
     """
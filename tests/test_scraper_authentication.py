@@ -16,9 +16,12 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from hypothesis import HealthCheck, given, settings
+from hypothesis import given, settings
 from hypothesis import strategies as st
+from linkedin_scraper.core.exceptions import AuthenticationError
 
+from linkedin_importer import scraper_client
+from linkedin_importer.scraper_client import LinkedInScraperClient
 from linkedin_importer.scraper_errors import (
     AuthError,
     CookieExpired,
@@ -50,6 +53,39 @@ def mock_runtime():
     return runtime
 
 
+def _install_login_stubs(mp: pytest.MonkeyPatch) -> list[tuple]:
+    """Replace both login helpers with plain recorders; return the call log."""
+    calls: list[tuple] = []
+
+    def _login_with_cookie(page, cookie):
+        calls.append(("cookie", page, cookie))
+
+    def _login_with_credentials(page, *, email, password, **kwargs):
+        calls.append(("credentials", page, email, password))
+
+    mp.setattr(scraper_client, "login_with_cookie", _login_with_cookie)
+    mp.setattr(scraper_client, "login_with_credentials", _login_with_credentials)
+    return calls
+
+
+@pytest.fixture
+def login_calls(monkeypatch):
+    """Stub the linkedin_scraper login helpers and record their calls."""
+    return _install_login_stubs(monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def property_client():
+    """Create one client for property tests that only exercise authenticate().
+
+    Each Hypothesis example resets ``authenticated`` instead of building a new
+    client; the injected mock runtime means no browser is started.
+    """
+    runtime = MagicMock()
+    runtime.run.return_value = None
+    return LinkedInScraperClient(headless=True, runtime=runtime)
+
+
 # =============================================================================
 # Cookie Authentication Tests
 # =============================================================================
@@ -59,13 +95,10 @@ class TestCookieAuthentication:
     """Tests for cookie-based authentication."""
 
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_cookie")
     def test_authenticate_with_cookie_calls_login_with_cookie(
-        self, mock_login_with_cookie, mock_runtime_class
+        self, mock_runtime_class, login_calls
     ):
         """Cookie auth should call login_with_cookie with the page and cookie."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         # Setup mock runtime
         mock_runtime = MagicMock()
         mock_runtime.page = MagicMock()
@@ -75,18 +108,14 @@ class TestCookieAuthentication:
         client = LinkedInScraperClient(headless=True)
         client.authenticate(cookie="test_cookie_value")
 
-        # Verify login_with_cookie was called via run
-        assert mock_runtime.run.called
+        assert login_calls == [("cookie", mock_runtime.page, "test_cookie_value")]
         assert client.authenticated is True
 
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_cookie")
     def test_authenticate_with_cookie_sets_authenticated_flag(
-        self, mock_login_with_cookie, mock_runtime_class
+        self, mock_runtime_class, login_calls
     ):
         """Cookie auth should set authenticated to True on success."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.page = MagicMock()
         mock_runtime.run = MagicMock(return_value=None)
@@ -99,15 +128,10 @@ class TestCookieAuthentication:
         assert client.authenticated is True
 
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_cookie")
     def test_authenticate_with_expired_cookie_raises_cookie_expired(
-        self, mock_login_with_cookie, mock_runtime_class
+        self, mock_runtime_class, login_calls
     ):
         """Cookie auth should raise CookieExpired when cookie is invalid."""
-        from linkedin_scraper.core.exceptions import AuthenticationError
-
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.page = MagicMock()
         mock_runtime.run = MagicMock(side_effect=AuthenticationError("Cookie expired"))
@@ -121,13 +145,10 @@ class TestCookieAuthentication:
         assert client.authenticated is False
 
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_cookie")
     def test_authenticate_with_cookie_exception_raises_auth_error(
-        self, mock_login_with_cookie, mock_runtime_class
+        self, mock_runtime_class, login_calls
     ):
         """Cookie auth should raise AuthError for unexpected exceptions."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.page = MagicMock()
         mock_runtime.run = MagicMock(side_effect=Exception("Network error"))
@@ -135,11 +156,9 @@ class TestCookieAuthentication:
 
         client = LinkedInScraperClient(headless=True)
 
-        with pytest.raises(AuthError) as exc_info:
+        with pytest.raises(AuthError, match="Cookie authentication failed"):
             client.authenticate(cookie="test_cookie")
 
-        assert "Cookie authentication failed" in str(exc_info.value)
-
 
 # =============================================================================
 # Credential Authentication Tests
@@ -150,13 +169,10 @@ class TestCredentialAuthentication:
     """Tests for email/password credential authentication."""
 
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_credentials")
     def test_authenticate_with_credentials_calls_login_with_credentials(
-        self, mock_login_with_credentials, mock_runtime_class
+        self, mock_runtime_class, login_calls
     ):
         """Credential auth should call login_with_credentials."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.page = MagicMock()
         mock_runtime.run = MagicMock(return_value=None)
@@ -165,17 +181,16 @@ class TestCredentialAuthentication:
         client = LinkedInScraperClient(headless=True, page_load_timeout=30)
         client.authenticate(email="user@example.com", password="password123")
 
-        assert mock_runtime.run.called
+        assert login_calls == [
+            ("credentials", mock_runtime.page, "user@example.com", "password123")
+        ]
         assert client.authenticated is True
 
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_credentials")
     def test_authenticate_with_credentials_sets_authenticated_flag(
-        self, mock_login_with_credentials, mock_runtime_class
+        self, mock_runtime_class, login_calls
     ):
         """Credential auth should set authenticated to True on success."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.page = MagicMock()
         mock_runtime.run = MagicMock(return_value=None)
@@ -188,15 +203,10 @@ class TestCredentialAuthentication:
         assert client.authenticated is True
 
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_credentials")
     def test_authenticate_with_credentials_auth_error(
-        self, mock_login_with_credentials, mock_runtime_class
+        self, mock_runtime_class, login_calls
     ):
         """Credential auth should raise AuthError on authentication failure."""
-        from linkedin_scraper.core.exceptions import AuthenticationError
-
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.page = MagicMock()
         mock_runtime.run = MagicMock(
@@ -206,10 +216,9 @@ class TestCredentialAuthentication:
 
         client = LinkedInScraperClient(headless=True)
 
-        with pytest.raises(AuthError) as exc_info:
+        with pytest.raises(AuthError, match="Credential authentication failed"):
             client.authenticate(email="user@example.com", password="wrong_password")
 
-        assert "Credential authentication failed" in str(exc_info.value)
         assert client.authenticated is False
 
 
@@ -222,13 +231,10 @@ class TestUnifiedAuthenticate:
     """Tests for the unified authenticate() method."""
 
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_cookie")
     def test_authenticate_uses_cookie_when_provided(
-        self, mock_login_with_cookie, mock_runtime_class
+        self, mock_runtime_class, login_calls
     ):
         """When cookie is provided, authenticate should use cookie auth."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.page = MagicMock()
         mock_runtime.run = MagicMock(return_value=None)
@@ -240,13 +246,10 @@ class TestUnifiedAuthenticate:
         assert client.authenticated is True
 
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_credentials")
     def test_authenticate_uses_credentials_when_no_cookie(
-        self, mock_login_with_credentials, mock_runtime_class
+        self, mock_runtime_class, login_calls
     ):
         """When no cookie, authenticate should use credentials."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.page = MagicMock()
         mock_runtime.run = MagicMock(return_value=None)
@@ -258,13 +261,10 @@ class TestUnifiedAuthenticate:
         assert client.authenticated is True
 
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_cookie")
     def test_authenticate_prefers_cookie_over_credentials(
-        self, mock_login_with_cookie, mock_runtime_class
+        self, mock_runtime_class, login_calls
     ):
         """When both cookie and credentials provided, cookie should be used."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.page = MagicMock()
         mock_runtime.run = MagicMock(return_value=None)
@@ -276,60 +276,34 @@ class TestUnifiedAuthenticate:
         )
 
         # Cookie auth should be used, credentials ignored
+        assert [call[0] for call in login_calls] == ["cookie"]
         assert client.authenticated is True
 
+    @pytest.mark.parametrize(
+        "auth_kwargs",
+        [
+            pytest.param({}, id="no-credentials"),
+            pytest.param({"email": "user@example.com"}, id="only-email"),
+            pytest.param({"password": "password123"}, id="only-password"),
+        ],
+    )
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_authenticate_raises_auth_error_when_no_credentials(
-        self, mock_runtime_class
+    def test_authenticate_raises_auth_error_without_usable_credentials(
+        self, mock_runtime_class, auth_kwargs
     ):
-        """When no auth method provided, should raise AuthError."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
+        """Without a cookie or a full email/password pair, raise AuthError."""
         mock_runtime = MagicMock()
-        mock_runtime.page = MagicMock()
-        mock_runtime.run = MagicMock()
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=True)
-
-        with pytest.raises(AuthError) as exc_info:
-            client.authenticate()
-
-        assert "requires either a valid LINKEDIN_COOKIE or email/password" in str(
-            exc_info.value
-        )
-
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_authenticate_raises_auth_error_with_only_email(self, mock_runtime_class):
-        """When only email provided (no password), should raise AuthError."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime.page = MagicMock()
-        mock_runtime.run = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
         client = LinkedInScraperClient(headless=True)
 
-        with pytest.raises(AuthError):
-            client.authenticate(email="user@example.com")
+        with pytest.raises(
+            AuthError, match="requires either a valid LINKEDIN_COOKIE or email/password"
+        ):
+            client.authenticate(**auth_kwargs)
 
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_authenticate_raises_auth_error_with_only_password(
-        self, mock_runtime_class
-    ):
-        """When only password provided (no email), should raise AuthError."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime.page = MagicMock()
-        mock_runtime.run = MagicMock()
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=True)
-
-        with pytest.raises(AuthError):
-            client.authenticate(password="password123")
+        mock_runtime.run.assert_not_called()
+        assert client.authenticated is False
 
 
 # =============================================================================
@@ -340,52 +314,34 @@ class TestUnifiedAuthenticate:
 class TestAuthenticationPropertyBased:
     """Property-based tests for authentication."""
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _stub_login(cls):
+        """Patch both login helpers once for the class, not once per example."""
+        with pytest.MonkeyPatch.context() as mp:
+            _install_login_stubs(mp)
+            yield
+
     @given(cookie=st.text(min_size=1, max_size=200).filter(lambda x: x.strip()))
-    @settings(
-        max_examples=20, suppress_health_check=[HealthCheck.function_scoped_fixture]
-    )
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_cookie")
-    def test_any_non_empty_cookie_attempts_auth(
-        self, mock_login_with_cookie, mock_runtime_class, cookie
-    ):
+    @settings(max_examples=20)
+    def test_any_non_empty_cookie_attempts_auth(self, property_client, cookie):
         """Any non-empty cookie string should attempt authentication."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime.page = MagicMock()
-        mock_runtime.run = MagicMock(return_value=None)
-        mock_runtime_class.return_value = mock_runtime
+        property_client.authenticated = False
+        property_client.authenticate(cookie=cookie)
 
-        client = LinkedInScraperClient(headless=True)
-        client.authenticate(cookie=cookie)
-
-        assert client.authenticated is True
+        assert property_client.authenticated is True
 
     @given(
         email=st.emails(),
         password=st.text(min_size=1, max_size=100).filter(lambda x: x.strip()),
     )
-    @settings(
-        max_examples=20, suppress_health_check=[HealthCheck.function_scoped_fixture]
-    )
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    @patch("linkedin_importer.scraper_client.login_with_credentials")
-    def test_valid_credentials_attempt_auth(
-        self, mock_login_with_credentials, mock_runtime_class, email, password
-    ):
+    @settings(max_examples=20)
+    def test_valid_credentials_attempt_auth(self, property_client, email, password):
         """Valid email and password should attempt authentication."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
+        property_client.authenticated = False
+        property_client.authenticate(email=email, password=password)
 
-        mock_runtime = MagicMock()
-        mock_runtime.page = MagicMock()
-        mock_runtime.run = MagicMock(return_value=None)
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=True)
-        client.authenticate(email=email, password=password)
-
-        assert client.authenticated is True
+        assert property_client.authenticated is True
 
 
 # =============================================================================
@@ -399,8 +355,6 @@ class TestDriverInfo:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_get_driver_info_returns_playwright_info(self, mock_runtime_class):
         """get_driver_info should return Playwright-specific info."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.page = MagicMock()
         mock_runtime_class.return_value = mock_runtime
@@ -423,8 +377,6 @@ class TestContextManager:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_enter_returns_client(self, mock_runtime_class):
         """__enter__ should return the client instance."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -436,8 +388,6 @@ class TestContextManager:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_exit_calls_close(self, mock_runtime_class):
         """__exit__ should call close()."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -449,8 +399,6 @@ class TestContextManager:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_close_resets_authenticated_flag(self, mock_runtime_class):
         """close() should reset authenticated to False."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.run = MagicMock(return_value=None)
         mock_runtime_class.return_value = mock_runtime
@@ -465,8 +413,6 @@ class TestContextManager:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_close_is_idempotent(self, mock_runtime_class):
         """close() should be safe to call multiple times."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
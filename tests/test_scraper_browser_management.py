@@ -11,9 +11,11 @@ from __future__ import annotations
 from unittest.mock import MagicMock, patch
 
 import pytest
-from hypothesis import HealthCheck, given, settings
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
+from linkedin_importer.scraper_client import LinkedInScraperClient, _PlaywrightRuntime
+
 
 class TestLinkedInScraperClientInitialization:
     """Test client initialization and configuration."""
@@ -21,8 +23,6 @@ class TestLinkedInScraperClientInitialization:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_default_initialization(self, mock_runtime_class):
         """Client should initialize with sensible defaults."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -41,8 +41,6 @@ class TestLinkedInScraperClientInitialization:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_custom_initialization(self, mock_runtime_class):
         """Client should accept custom configuration."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -70,8 +68,6 @@ class TestLinkedInScraperClientInitialization:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_headless_defaults_to_true(self, mock_runtime_class):
         """Headless should default to True when not specified."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -82,8 +78,6 @@ class TestLinkedInScraperClientInitialization:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_headless_none_becomes_true(self, mock_runtime_class):
         """Headless=None should default to True."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -94,8 +88,6 @@ class TestLinkedInScraperClientInitialization:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_chromedriver_path_accepted_but_ignored(self, mock_runtime_class):
         """chromedriver_path should be accepted for backward compatibility but ignored."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -112,8 +104,6 @@ class TestPlaywrightRuntimeLifecycle:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_runtime_started_on_init(self, mock_runtime_class):
         """Runtime should be started during client initialization."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -124,8 +114,6 @@ class TestPlaywrightRuntimeLifecycle:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_runtime_receives_headless_config(self, mock_runtime_class):
         """Runtime should be configured with headless setting."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -136,8 +124,6 @@ class TestPlaywrightRuntimeLifecycle:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_runtime_receives_user_agent(self, mock_runtime_class):
         """Runtime should be configured with user agent if provided."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -147,11 +133,20 @@ class TestPlaywrightRuntimeLifecycle:
             headless=True, user_agent="Custom Agent/1.0"
         )
 
+    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
+    def test_injected_runtime_used_without_starting(self, mock_runtime_class):
+        """An injected runtime should be used as-is, not created or started."""
+        injected_runtime = MagicMock()
+
+        client = LinkedInScraperClient(headless=True, runtime=injected_runtime)
+
+        assert client._runtime is injected_runtime
+        mock_runtime_class.assert_not_called()
+        injected_runtime.start.assert_not_called()
+
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_runtime_stopped_on_close(self, mock_runtime_class):
         """Runtime should be stopped when client is closed."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -163,8 +158,6 @@ class TestPlaywrightRuntimeLifecycle:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_close_resets_authenticated(self, mock_runtime_class):
         """close() should reset authenticated flag."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -178,8 +171,6 @@ class TestPlaywrightRuntimeLifecycle:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_close_is_idempotent(self, mock_runtime_class):
         """close() should be safe to call multiple times."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -200,8 +191,6 @@ class TestContextManager:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_sync_context_manager_enter_returns_client(self, mock_runtime_class):
         """__enter__ should return the client instance."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -213,8 +202,6 @@ class TestContextManager:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_sync_context_manager_exit_closes(self, mock_runtime_class):
         """__exit__ should close the client."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -226,8 +213,6 @@ class TestContextManager:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_with_statement_usage(self, mock_runtime_class):
         """Client should work with 'with' statement."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -241,8 +226,6 @@ class TestContextManager:
     @pytest.mark.asyncio
     async def test_async_context_manager_enter_returns_client(self, mock_runtime_class):
         """__aenter__ should return the client instance."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -255,8 +238,6 @@ class TestContextManager:
     @pytest.mark.asyncio
     async def test_async_context_manager_exit_closes(self, mock_runtime_class):
         """__aexit__ should close the client."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -266,46 +247,35 @@ class TestContextManager:
         mock_runtime.stop.assert_called()
 
 
+@pytest.fixture(scope="module")
+def readonly_client():
+    """Build one client for tests that only read from it.
+
+    get_driver_info() touches no runtime or authentication state, so a single
+    client over an injected mock runtime serves the whole module.
+    """
+    return LinkedInScraperClient(headless=True, runtime=MagicMock())
+
+
 class TestDriverInfo:
     """Test driver info functionality."""
 
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_get_driver_info_returns_dict(self, mock_runtime_class):
+    def test_get_driver_info_returns_dict(self, readonly_client):
         """get_driver_info should return a dictionary."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=True)
-        info = client.get_driver_info()
+        info = readonly_client.get_driver_info()
 
         assert isinstance(info, dict)
 
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_get_driver_info_contains_chrome_version(self, mock_runtime_class):
+    def test_get_driver_info_contains_chrome_version(self, readonly_client):
         """get_driver_info should contain chrome_version."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=True)
-        info = client.get_driver_info()
+        info = readonly_client.get_driver_info()
 
         assert "chrome_version" in info
         assert info["chrome_version"] == "playwright-chromium"
 
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_get_driver_info_contains_driver_version(self, mock_runtime_class):
+    def test_get_driver_info_contains_driver_version(self, readonly_client):
         """get_driver_info should contain driver_version."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=True)
-        info = client.get_driver_info()
+        info = readonly_client.get_driver_info()
 
         assert "driver_version" in info
         assert info["driver_version"] == "playwright"
@@ -316,8 +286,6 @@ class TestPlaywrightRuntimeInternal:
 
     def test_runtime_creates_event_loop(self):
         """Runtime should create its own event loop."""
-        from linkedin_importer.scraper_client import _PlaywrightRuntime
-
         runtime = _PlaywrightRuntime(headless=True)
 
         assert runtime._loop is not None
@@ -325,8 +293,6 @@ class TestPlaywrightRuntimeInternal:
 
     def test_runtime_stores_config(self):
         """Runtime should store headless and user_agent config."""
-        from linkedin_importer.scraper_client import _PlaywrightRuntime
-
         runtime = _PlaywrightRuntime(headless=False, user_agent="Test Agent")
 
         assert runtime.headless is False
@@ -334,8 +300,6 @@ class TestPlaywrightRuntimeInternal:
 
     def test_runtime_page_initially_none(self):
         """Runtime page should be None before start."""
-        from linkedin_importer.scraper_client import _PlaywrightRuntime
-
         runtime = _PlaywrightRuntime(headless=True)
 
         assert runtime._page is None
@@ -344,100 +308,46 @@ class TestPlaywrightRuntimeInternal:
 class TestPropertyBasedConfiguration:
     """Property-based tests for configuration."""
 
-    @given(headless=st.booleans())
-    @settings(
-        max_examples=10, suppress_health_check=[HealthCheck.function_scoped_fixture]
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _patched_runtime(cls):
+        """Patch the Playwright runtime once for the class, not per example."""
+        with patch("linkedin_importer.scraper_client._PlaywrightRuntime"):
+            yield
+
+    @given(
+        headless=st.booleans(),
+        timeout=st.integers(min_value=5, max_value=120),
+        user_agent=st.text(min_size=1, max_size=200),
+        max_retries=st.integers(min_value=1, max_value=10),
+        action_delay=st.floats(min_value=0.5, max_value=10.0),
+        scroll_delay=st.floats(min_value=0.1, max_value=5.0),
     )
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_headless_preserved(self, mock_runtime_class, headless):
-        """Headless setting should be preserved."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=headless)
+    @settings(max_examples=10, deadline=None, database=None)
+    def test_configuration_preserved(
+        self,
+        headless,
+        timeout,
+        user_agent,
+        max_retries,
+        action_delay,
+        scroll_delay,
+    ):
+        """Every configuration option should be preserved on the client."""
+        client = LinkedInScraperClient(
+            headless=headless,
+            page_load_timeout=timeout,
+            user_agent=user_agent,
+            max_retries=max_retries,
+            action_delay=action_delay,
+            scroll_delay=scroll_delay,
+        )
 
         assert client.headless == headless
-
-    @given(timeout=st.integers(min_value=5, max_value=120))
-    @settings(
-        max_examples=10, suppress_health_check=[HealthCheck.function_scoped_fixture]
-    )
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_timeout_preserved(self, mock_runtime_class, timeout):
-        """Page load timeout should be preserved."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=True, page_load_timeout=timeout)
-
         assert client.page_load_timeout == timeout
-
-    @given(user_agent=st.text(min_size=1, max_size=200))
-    @settings(
-        max_examples=10, suppress_health_check=[HealthCheck.function_scoped_fixture]
-    )
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_user_agent_preserved(self, mock_runtime_class, user_agent):
-        """User agent should be preserved."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=True, user_agent=user_agent)
-
         assert client.user_agent == user_agent
-
-    @given(max_retries=st.integers(min_value=1, max_value=10))
-    @settings(
-        max_examples=10, suppress_health_check=[HealthCheck.function_scoped_fixture]
-    )
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_max_retries_preserved(self, mock_runtime_class, max_retries):
-        """Max retries should be preserved."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=True, max_retries=max_retries)
-
         assert client.max_retries == max_retries
-
-    @given(action_delay=st.floats(min_value=0.5, max_value=10.0))
-    @settings(
-        max_examples=10, suppress_health_check=[HealthCheck.function_scoped_fixture]
-    )
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_action_delay_preserved(self, mock_runtime_class, action_delay):
-        """Action delay should be preserved."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=True, action_delay=action_delay)
-
         assert client.action_delay == action_delay
-
-    @given(scroll_delay=st.floats(min_value=0.1, max_value=5.0))
-    @settings(
-        max_examples=10, suppress_health_check=[HealthCheck.function_scoped_fixture]
-    )
-    @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
-    def test_scroll_delay_preserved(self, mock_runtime_class, scroll_delay):
-        """Scroll delay should be preserved."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
-        mock_runtime = MagicMock()
-        mock_runtime_class.return_value = mock_runtime
-
-        client = LinkedInScraperClient(headless=True, scroll_delay=scroll_delay)
-
         assert client.scroll_delay == scroll_delay
 
 
@@ -447,8 +357,6 @@ class TestAuthenticatedState:
     @patch("linkedin_importer.scraper_client._PlaywrightRuntime")
     def test_initially_not_authenticated(self, mock_runtime_class):
         """Client should not be authenticated initially."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime_class.return_value = mock_runtime
 
@@ -462,8 +370,6 @@ class TestAuthenticatedState:
         self, mock_login_with_cookie, mock_runtime_class
     ):
         """Client should be authenticated after successful cookie login."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.run = MagicMock(return_value=None)
         mock_runtime_class.return_value = mock_runtime
@@ -479,8 +385,6 @@ class TestAuthenticatedState:
         self, mock_login_with_credentials, mock_runtime_class
     ):
         """Client should be authenticated after successful credentials login."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.run = MagicMock(return_value=None)
         mock_runtime_class.return_value = mock_runtime
@@ -496,8 +400,6 @@ class TestAuthenticatedState:
         self, mock_login_with_cookie, mock_runtime_class
     ):
         """close() should reset authenticated state."""
-        from linkedin_importer.scraper_client import LinkedInScraperClient
-
         mock_runtime = MagicMock()
         mock_runtime.run = MagicMock(return_value=None)
         mock_runtime_class.return_value = mock_runtime
@@ -6,6 +6,7 @@ and recoverable flag behavior for all scraper error classes.
 Validates Requirements: 8.1, 8.2, 8.4, 8.5
 """
 
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -29,16 +30,14 @@ from linkedin_importer.scraper_errors import (
 
 # Hypothesis strategies
 error_messages = st.text(min_size=1, max_size=200).filter(lambda x: x.strip())
-error_details = st.dictionaries(
-    keys=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
-    values=st.one_of(
-        st.text(max_size=100),
-        st.integers(),
-        st.booleans(),
-        st.none(),
-    ),
-    min_size=0,
-    max_size=5,
+error_details = st.fixed_dictionaries(
+    {},
+    optional={
+        "driver_info": st.text(max_size=100),
+        "code": st.integers(),
+        "flag": st.booleans(),
+        "extra": st.none() | st.text(max_size=50),
+    },
 )
 profile_urls = st.text(min_size=5, max_size=200).map(
     lambda x: f"https://linkedin.com/in/{x.replace('/', '-')}"
@@ -48,65 +47,50 @@ selectors = st.text(min_size=1, max_size=100).filter(lambda x: x.strip())
 timeout_values = st.integers(min_value=1, max_value=300)
 retry_after_values = st.integers(min_value=1, max_value=3600)
 
+# One no-arg factory per concrete scraper error class, identified by class name
+_ERROR_FACTORIES = [
+    pytest.param(lambda: ScraperError("test"), id="ScraperError"),
+    pytest.param(lambda: BrowserError("test"), id="BrowserError"),
+    pytest.param(lambda: ScraperAuthError("test"), id="ScraperAuthError"),
+    pytest.param(lambda: TwoFactorRequired(), id="TwoFactorRequired"),
+    pytest.param(lambda: CookieExpired(), id="CookieExpired"),
+    pytest.param(
+        lambda: ProfileNotFound("https://linkedin.com/in/test"), id="ProfileNotFound"
+    ),
+    pytest.param(lambda: ScrapingBlocked(), id="ScrapingBlocked"),
+    pytest.param(lambda: ElementNotFound("element"), id="ElementNotFound"),
+    pytest.param(
+        lambda: PageLoadTimeout("https://linkedin.com", 30), id="PageLoadTimeout"
+    ),
+]
+
 
 class TestScraperErrorHierarchy:
     """Test the inheritance hierarchy of scraper error classes."""
 
-    def test_scraper_error_extends_import_error(self):
-        """ScraperError should extend ImportError."""
-        error = ScraperError("test message")
-        assert isinstance(error, ImportError)
-        assert isinstance(error, Exception)
-
-    def test_browser_error_extends_scraper_error(self):
-        """BrowserError should extend ScraperError."""
-        error = BrowserError("test message")
-        assert isinstance(error, ScraperError)
-        assert isinstance(error, ImportError)
-
-    def test_scraper_auth_error_extends_scraper_error(self):
-        """ScraperAuthError should extend ScraperError."""
-        error = ScraperAuthError("test message")
-        assert isinstance(error, ScraperError)
-        assert isinstance(error, ImportError)
-
-    def test_two_factor_required_extends_scraper_auth_error(self):
-        """TwoFactorRequired should extend ScraperAuthError (Requirement 8.2)."""
-        error = TwoFactorRequired()
-        assert isinstance(error, ScraperAuthError)
-        assert isinstance(error, ScraperError)
-        assert isinstance(error, ImportError)
-
-    def test_cookie_expired_extends_scraper_auth_error(self):
-        """CookieExpired should extend ScraperAuthError (Requirements 8.1, 8.2)."""
-        error = CookieExpired()
-        assert isinstance(error, ScraperAuthError)
-        assert isinstance(error, ScraperError)
-        assert isinstance(error, ImportError)
-
-    def test_profile_not_found_extends_scraper_error(self):
-        """ProfileNotFound should extend ScraperError (Requirement 8.1)."""
-        error = ProfileNotFound("https://linkedin.com/in/test")
-        assert isinstance(error, ScraperError)
-        assert isinstance(error, ImportError)
-
-    def test_scraping_blocked_extends_scraper_error(self):
-        """ScrapingBlocked should extend ScraperError (Requirement 8.5)."""
-        error = ScrapingBlocked()
-        assert isinstance(error, ScraperError)
-        assert isinstance(error, ImportError)
-
-    def test_element_not_found_extends_scraper_error(self):
-        """ElementNotFound should extend ScraperError (Requirement 8.4)."""
-        error = ElementNotFound("profile-name")
-        assert isinstance(error, ScraperError)
-        assert isinstance(error, ImportError)
-
-    def test_page_load_timeout_extends_scraper_error(self):
-        """PageLoadTimeout should extend ScraperError."""
-        error = PageLoadTimeout("https://linkedin.com", 30)
-        assert isinstance(error, ScraperError)
-        assert isinstance(error, ImportError)
+    @pytest.mark.parametrize(
+        "cls,bases",
+        [
+            (ScraperError, (ImportError, Exception)),
+            (BrowserError, (ScraperError, ImportError)),
+            (ScraperAuthError, (ScraperError, ImportError)),
+            # Requirement 8.2
+            (TwoFactorRequired, (ScraperAuthError, ScraperError, ImportError)),
+            # Requirements 8.1, 8.2
+            (CookieExpired, (ScraperAuthError, ScraperError, ImportError)),
+            # Requirement 8.1
+            (ProfileNotFound, (ScraperError, ImportError)),
+            # Requirement 8.5
+            (ScrapingBlocked, (ScraperError, ImportError)),
+            # Requirement 8.4
+            (ElementNotFound, (ScraperError, ImportError)),
+            (PageLoadTimeout, (ScraperError, ImportError)),
+        ],
+        ids=lambda value: value.__name__ if isinstance(value, type) else None,
+    )
+    def test_error_extends_bases(self, cls: type, bases: tuple[type, ...]):
+        """Each scraper error class should extend all of its expected bases."""
+        assert all(issubclass(cls, base) for base in bases)
 
     def test_auth_error_alias_is_scraper_auth_error(self):
         """AuthError should be an alias for ScraperAuthError."""
@@ -182,26 +166,24 @@ class TestScraperErrorMessages:
         error = BrowserError(
             "Failed to initialize browser: chromedriver not found", details
         )
-        assert (
-            "chromedriver" in str(error).lower()
-            or "chromedriver" in error.message.lower()
-        )
+        # str(error) embeds the message, so one lowered copy covers both
+        assert "chromedriver" in str(error).lower()
         assert error.details["driver_info"] == "chromedriver 114.0.5735.90"
 
     def test_two_factor_required_default_message(self):
         """TwoFactorRequired should have a descriptive default message."""
         error = TwoFactorRequired()
-        assert "two-factor" in error.message.lower() or "2fa" in error.message.lower()
-        assert (
-            "complete" in error.message.lower() or "challenge" in error.message.lower()
-        )
+        msg = error.message.lower()
+        assert "two-factor" in msg or "2fa" in msg
+        assert "complete" in msg or "challenge" in msg
 
     def test_cookie_expired_default_message_includes_refresh_suggestion(self):
         """CookieExpired message should suggest refreshing cookie (Requirement 8.1)."""
         error = CookieExpired()
-        assert "expired" in error.message.lower()
-        assert "fresh" in error.message.lower() or "obtain" in error.message.lower()
-        assert "li_at" in error.message or "cookie" in error.message.lower()
+        msg = error.message.lower()
+        assert "expired" in msg
+        assert "fresh" in msg or "obtain" in msg
+        assert "li_at" in msg or "cookie" in msg
 
     def test_profile_not_found_includes_url(self):
         """ProfileNotFound message should include the profile URL (Requirement 8.1)."""
@@ -213,8 +195,9 @@ class TestScraperErrorMessages:
     def test_scraping_blocked_default_message(self):
         """ScrapingBlocked should have a descriptive default message."""
         error = ScrapingBlocked()
-        assert "blocked" in error.message.lower()
-        assert "try again" in error.message.lower() or "later" in error.message.lower()
+        msg = error.message.lower()
+        assert "blocked" in msg
+        assert "try again" in msg or "later" in msg
 
     def test_scraping_blocked_with_retry_after(self):
         """ScrapingBlocked with retry_after should include wait time."""
@@ -231,7 +214,8 @@ class TestScraperErrorMessages:
     def test_element_not_found_suggests_layout_change(self):
         """ElementNotFound should suggest possible layout change (Requirement 8.4)."""
         error = ElementNotFound("profile-name")
-        assert "layout" in error.message.lower() or "changed" in error.message.lower()
+        msg = error.message.lower()
+        assert "layout" in msg or "changed" in msg
 
     def test_element_not_found_includes_selector_in_details(self):
         """ElementNotFound should include selector in details when provided."""
@@ -367,9 +351,8 @@ class TestScraperErrorExceptions:
 
     def test_scraper_error_can_be_raised_and_caught(self):
         """ScraperError should be raisable and catchable."""
-        with pytest.raises(ScraperError) as exc_info:
+        with pytest.raises(ScraperError, match="test error"):
             raise ScraperError("test error")
-        assert "test error" in str(exc_info.value)
 
     def test_catch_browser_error_as_scraper_error(self):
         """BrowserError should be catchable as ScraperError."""
@@ -386,22 +369,22 @@ class TestScraperErrorExceptions:
         with pytest.raises(ScraperAuthError):
             raise CookieExpired()
 
-    def test_catch_all_scraper_errors_as_import_error(self):
+    @pytest.mark.parametrize("factory", _ERROR_FACTORIES)
+    def test_catch_all_scraper_errors_as_import_error(
+        self, factory: Callable[[], ScraperError]
+    ):
         """All scraper errors should be catchable as ImportError."""
-        errors = [
-            ScraperError("test"),
-            BrowserError("test"),
-            ScraperAuthError("test"),
-            TwoFactorRequired(),
-            CookieExpired(),
-            ProfileNotFound("https://linkedin.com/in/test"),
-            ScrapingBlocked(),
-            ElementNotFound("element"),
-            PageLoadTimeout("https://linkedin.com", 30),
-        ]
-        for error in errors:
-            with pytest.raises(ImportError):
-                raise error
+        with pytest.raises(ImportError):
+            raise factory()
+
+    @pytest.mark.parametrize("factory", _ERROR_FACTORIES)
+    def test_all_scraper_errors_use_scraper_error_type(
+        self, factory: Callable[[], ScraperError]
+    ):
+        """All scraper errors should report the "scraper" error type."""
+        error = factory()
+        assert error.error_type == "scraper"
+        assert str(error).startswith("[scraper] ")
 
 
 class TestScraperErrorRealWorldScenarios:
@@ -440,7 +423,8 @@ class TestScraperErrorRealWorldScenarios:
             }
         )
         assert error.recoverable is True
-        assert "2fa" in error.message.lower() or "two-factor" in error.message.lower()
+        msg = error.message.lower()
+        assert "2fa" in msg or "two-factor" in msg
 
     def test_profile_does_not_exist(self):
         """Test profile not found scenario."""
@@ -1,114 +1,159 @@
 """Property-based tests for data validation."""
 
+import dataclasses
+import os
+
 import pytest
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from linkedin_importer.errors import ValidationError
-from linkedin_importer.models import LinkedInProfile
+from linkedin_importer.models import (
+    Certification,
+    LinkedInProfile,
+    Position,
+    Publication,
+)
 from linkedin_importer.validation import (
     validate_profile_urls,
     validate_required_fields,
 )
 
-
-# Feature: linkedin-profile-importer, Property 2: Required field validation
-# Validates: Requirements 1.2
-@given(
-    first_name=st.one_of(
-        st.just(""),  # Empty string
-        st.from_regex(r"^\s+$", fullmatch=True),  # Whitespace only
-        st.none(),  # None value
-    ),
-    last_name=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
-    email=st.emails(),
+# Profiles are registered in conftest.py; HYP_PROFILE selects another one.
+_VALIDATION_SETTINGS = settings.get_profile(
+    os.environ.get("HYP_PROFILE", "validation_fast")
 )
-def test_missing_first_name_validation(first_name, last_name: str, email: str) -> None:
-    """For any profile with missing or empty first_name, validation should fail."""
-    profile = LinkedInProfile(
-        profile_id="test123",
-        first_name=first_name,
-        last_name=last_name,
-        email=email,
-    )
-
-    with pytest.raises(ValidationError) as exc_info:
-        validate_required_fields(profile)
-
-    # Verify error message mentions first_name
-    error = exc_info.value
-    assert error.error_type == "validation"
-    assert "first_name" in str(error.details).lower()
 
-
-# Feature: linkedin-profile-importer, Property 2: Required field validation
-# Validates: Requirements 1.2
-@given(
-    first_name=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
-    last_name=st.one_of(
-        st.just(""),  # Empty string
-        st.from_regex(r"^\s+$", fullmatch=True),  # Whitespace only
-        st.none(),  # None value
-    ),
-    email=st.emails(),
+# Fixed records that each example copies with only the field under test changed
+_BASE_PROFILE = LinkedInProfile(
+    profile_id="test123",
+    first_name="John",
+    last_name="Doe",
+    email="john@example.com",
+)
+_BASE_POSITION = Position(company_name="Test Company", title="Engineer")
+_BASE_CERTIFICATION = Certification(name="Test Cert", authority="Test Authority")
+_BASE_PUBLICATION = Publication(name="Test Publication")
+
+# Strategies shared across tests, built once at import time
+_WHITESPACE_ONLY = st.from_regex(r"^\s+$", fullmatch=True)
+_BLANK = st.one_of(
+    st.just(""),  # Empty string
+    _WHITESPACE_ONLY,  # Whitespace only
+    st.none(),  # None value
 )
-def test_missing_last_name_validation(first_name: str, last_name, email: str) -> None:
-    """For any profile with missing or empty last_name, validation should fail."""
-    profile = LinkedInProfile(
-        profile_id="test123",
-        first_name=first_name,
-        last_name=last_name,
-        email=email,
+# A printable, non-space first character makes every draw non-blank without
+# rejection sampling.
+_NON_WS_CHAR = st.characters(min_codepoint=0x21, max_codepoint=0x7E)
+_NON_EMPTY_TEXT = st.builds(
+    lambda first, rest: first + rest, _NON_WS_CHAR, st.text(max_size=49)
+)
+# Well-formed filler addresses for tests where email is not under test. All
+# ASCII, since EMAIL_REGEX rejects internationalised domains.
+_VALID_EMAILS = st.sampled_from(
+    (
+        "a@b.co",
+        "user@example.com",
+        "first.last@sub.example.org",
+        "x+tag@example.io",
+        "user123@test.co.uk",
+        "a.b.c@d.ef",
+        "x@y.zz",
     )
-
+)
+_NO_AT_TEXT = st.text(
+    alphabet=st.characters(blacklist_characters="@", blacklist_categories=("Cs",)),
+    min_size=1,
+    max_size=20,
+)
+_MISSING_DOMAIN = st.builds(lambda local: local + "@", _NO_AT_TEXT)
+_MISSING_LOCAL_PART = st.builds(lambda domain: "@" + domain, _NO_AT_TEXT)
+_VALID_HTTP_URL = st.from_regex(
+    r"^https?://[a-z0-9]+\.[a-z]{2,}(/.*)?$", fullmatch=True
+)
+# Pre-vetted URLs that validate_url rejects. The empty string is left out
+# because validate_profile_urls skips falsy URLs.
+_INVALID_URLS = (
+    "ftp://example.com",  # Wrong scheme
+    "ftp://files.example.org/pub/report.pdf",  # Wrong scheme with a path
+    "not-a-url",  # No scheme
+    "http://",  # Missing netloc
+    "https://",  # Missing netloc
+    "javascript:alert(1)",  # Invalid scheme
+    "file:///etc/passwd",  # File scheme
+    "notaurl",  # No scheme separator
+    "plain text",
+    "abc 123",
+    "mailto:x@y.z",  # Non-HTTP scheme
+    "//noscheme.com",  # Scheme-relative
+)
+_INVALID_URL = st.sampled_from(_INVALID_URLS)
+
+# Every place validate_profile_urls looks for a URL, as
+# (list field on the profile, template record, URL attribute). Profile-level
+# fields have no list field or template.
+_URL_LOCATIONS = [
+    pytest.param((None, None, "profile_picture_url"), id="profile_picture"),
+    pytest.param(("positions", _BASE_POSITION, "company_url"), id="position"),
+    pytest.param(("positions", _BASE_POSITION, "company_logo_url"), id="position_logo"),
+    pytest.param(("certifications", _BASE_CERTIFICATION, "url"), id="certification"),
+    pytest.param(("publications", _BASE_PUBLICATION, "url"), id="publication"),
+]
+
+
+def _profile_with_url(list_field, template, url_field, url) -> LinkedInProfile:
+    """Copy the base profile with ``url`` placed at the given location."""
+    if list_field is None:
+        return dataclasses.replace(_BASE_PROFILE, **{url_field: url})
+    record = dataclasses.replace(template, **{url_field: url})
+    return dataclasses.replace(_BASE_PROFILE, **{list_field: [record]})
+
+
+def _assert_field_error(profile: LinkedInProfile, validator, field: str) -> None:
+    """Assert ``validator`` rejects ``profile`` with an error naming ``field``."""
     with pytest.raises(ValidationError) as exc_info:
-        validate_required_fields(profile)
+        validator(profile)
 
-    # Verify error message mentions last_name
     error = exc_info.value
     assert error.error_type == "validation"
-    assert "last_name" in str(error.details).lower()
+    assert any(
+        message.startswith(f"{field} ")
+        for message in error.details["validation_errors"]
+    )
 
 
 # Feature: linkedin-profile-importer, Property 2: Required field validation
 # Validates: Requirements 1.2
+@pytest.mark.parametrize("field", ["first_name", "last_name", "email"])
+@settings(_VALIDATION_SETTINGS)
 @given(
-    first_name=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
-    last_name=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
-    email=st.one_of(
-        st.just(""),  # Empty string
-        st.from_regex(r"^\s+$", fullmatch=True),  # Whitespace only
-        st.none(),  # None value
-    ),
+    empty_value=_BLANK,
+    good_first=_NON_EMPTY_TEXT,
+    good_last=_NON_EMPTY_TEXT,
+    good_email=_VALID_EMAILS,
 )
-def test_missing_email_validation(first_name: str, last_name: str, email) -> None:
-    """For any profile with missing or empty email, validation should fail."""
-    profile = LinkedInProfile(
-        profile_id="test123",
-        first_name=first_name,
-        last_name=last_name,
-        email=email,
-    )
+def test_missing_required_field_validation(
+    field: str, empty_value, good_first: str, good_last: str, good_email: str
+) -> None:
+    """For any profile with a missing or empty required field, validation should fail."""
+    kwargs = {"first_name": good_first, "last_name": good_last, "email": good_email}
+    kwargs[field] = empty_value
+    profile = dataclasses.replace(_BASE_PROFILE, **kwargs)
 
-    with pytest.raises(ValidationError) as exc_info:
-        validate_required_fields(profile)
-
-    # Verify error message mentions email
-    error = exc_info.value
-    assert error.error_type == "validation"
-    assert "email" in str(error.details).lower()
+    _assert_field_error(profile, validate_required_fields, field)
 
 
 # Feature: linkedin-profile-importer, Property 2: Required field validation
 # Validates: Requirements 1.2
+@settings(_VALIDATION_SETTINGS)
 @given(
-    first_name=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
-    last_name=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
+    first_name=_NON_EMPTY_TEXT,
+    last_name=_NON_EMPTY_TEXT,
     # Generate invalid email formats
     email=st.one_of(
-        st.text(min_size=1, max_size=20).filter(lambda x: "@" not in x),  # No @ symbol
-        st.from_regex(r"^[^@]+@$", fullmatch=True),  # Missing domain
-        st.from_regex(r"^@[^@]+$", fullmatch=True),  # Missing local part
+        _NO_AT_TEXT,  # No @ symbol
+        _MISSING_DOMAIN,  # Missing domain
+        _MISSING_LOCAL_PART,  # Missing local part
         st.just("test@"),  # Ends with @
         st.just("@test"),  # Starts with @
         st.just("test@@test.com"),  # Double @
@@ -119,36 +164,25 @@ def test_invalid_email_format_validation(
     first_name: str, last_name: str, email: str
 ) -> None:
     """For any profile with improperly formatted email, validation should fail."""
-    profile = LinkedInProfile(
-        profile_id="test123",
-        first_name=first_name,
-        last_name=last_name,
-        email=email,
+    profile = dataclasses.replace(
+        _BASE_PROFILE, first_name=first_name, last_name=last_name, email=email
     )
 
-    with pytest.raises(ValidationError) as exc_info:
-        validate_required_fields(profile)
-
-    # Verify error message mentions email validation
-    error = exc_info.value
-    assert error.error_type == "validation"
-    assert "email" in str(error.details).lower()
+    _assert_field_error(profile, validate_required_fields, "email")
 
 
 # Feature: linkedin-profile-importer, Property 2: Required field validation
 # Validates: Requirements 1.2
+@settings(_VALIDATION_SETTINGS)
 @given(
-    first_name=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
-    last_name=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
+    first_name=_NON_EMPTY_TEXT,
+    last_name=_NON_EMPTY_TEXT,
     email=st.emails(),
 )
 def test_valid_required_fields(first_name: str, last_name: str, email: str) -> None:
     """For any profile with all required fields properly formatted, validation should pass."""
-    profile = LinkedInProfile(
-        profile_id="test123",
-        first_name=first_name,
-        last_name=last_name,
-        email=email,
+    profile = dataclasses.replace(
+        _BASE_PROFILE, first_name=first_name, last_name=last_name, email=email
     )
 
     # Should not raise any exception
@@ -157,22 +191,18 @@ def test_valid_required_fields(first_name: str, last_name: str, email: str) -> N
 
 # Feature: linkedin-profile-importer, Property 11: URL validation
 # Validates: Requirements 4.5
+@pytest.mark.parametrize("location", _URL_LOCATIONS)
+@settings(_VALIDATION_SETTINGS)
 @given(
-    profile_picture_url=st.one_of(
-        st.just("http://example.com/image.jpg"),
-        st.just("https://example.com/image.jpg"),
+    # None first: it is the simplest draw and what the shrinker heads for
+    url=st.one_of(
         st.none(),  # None is valid (optional field)
+        _VALID_HTTP_URL,
     ),
 )
-def test_valid_profile_picture_url(profile_picture_url) -> None:
-    """For any valid HTTP/HTTPS URL or None, URL validation should pass."""
-    profile = LinkedInProfile(
-        profile_id="test123",
-        first_name="John",
-        last_name="Doe",
-        email="john@example.com",
-        profile_picture_url=profile_picture_url,
-    )
+def test_valid_url(location, url) -> None:
+    """For any valid HTTP/HTTPS URL or None in any URL field, URL validation should pass."""
+    profile = _profile_with_url(*location, url)
 
     # Should not raise any exception
     validate_profile_urls(profile)
@@ -180,180 +210,14 @@ def test_valid_profile_picture_url(profile_picture_url) -> None:
 
 # Feature: linkedin-profile-importer, Property 11: URL validation
 # Validates: Requirements 4.5
-@given(
-    # Generate invalid URLs
-    invalid_url=st.one_of(
-        st.just("ftp://example.com"),  # Wrong scheme
-        st.just("not-a-url"),  # No scheme
-        st.just("http://"),  # Missing netloc
-        st.just("https://"),  # Missing netloc
-        st.just("javascript:alert(1)"),  # Invalid scheme
-        st.just("file:///etc/passwd"),  # File scheme
-        st.text(min_size=1, max_size=20).filter(
-            lambda x: "://" not in x
-        ),  # No scheme separator
-    ),
-)
-def test_invalid_profile_picture_url(invalid_url: str) -> None:
-    """For any invalid URL in profile_picture_url, validation should fail."""
-    profile = LinkedInProfile(
-        profile_id="test123",
-        first_name="John",
-        last_name="Doe",
-        email="john@example.com",
-        profile_picture_url=invalid_url,
-    )
-
-    with pytest.raises(ValidationError) as exc_info:
-        validate_profile_urls(profile)
-
-    # Verify error message mentions URL validation
-    error = exc_info.value
-    assert error.error_type == "validation"
-    assert "url" in str(error.details).lower()
-
-
-# Feature: linkedin-profile-importer, Property 11: URL validation
-# Validates: Requirements 4.5
-@given(
-    # Generate valid HTTP/HTTPS URLs
-    company_url=st.one_of(
-        st.from_regex(r"^https?://[a-z0-9]+\.[a-z]{2,}(/.*)?$", fullmatch=True),
-        st.none(),  # None is valid (optional field)
-    ),
-)
-def test_valid_position_company_url(company_url) -> None:
-    """For any valid HTTP/HTTPS URL or None in position, URL validation should pass."""
-    from linkedin_importer.models import Position
-
-    profile = LinkedInProfile(
-        profile_id="test123",
-        first_name="John",
-        last_name="Doe",
-        email="john@example.com",
-        positions=[
-            Position(
-                company_name="Test Company",
-                title="Engineer",
-                company_url=company_url,
-            )
-        ],
-    )
-
-    # Should not raise any exception
-    validate_profile_urls(profile)
-
-
-# Feature: linkedin-profile-importer, Property 11: URL validation
-# Validates: Requirements 4.5
-@given(
-    # Generate invalid URLs
-    invalid_url=st.one_of(
-        st.just("ftp://example.com"),  # Wrong scheme
-        st.just("not-a-url"),  # No scheme
-        st.just("http://"),  # Missing netloc
-        st.text(min_size=1, max_size=20).filter(
-            lambda x: "://" not in x and x.strip()
-        ),  # No scheme
-    ),
-)
-def test_invalid_position_company_url(invalid_url: str) -> None:
-    """For any invalid URL in position company_url, validation should fail."""
-    from linkedin_importer.models import Position
-
-    profile = LinkedInProfile(
-        profile_id="test123",
-        first_name="John",
-        last_name="Doe",
-        email="john@example.com",
-        positions=[
-            Position(
-                company_name="Test Company",
-                title="Engineer",
-                company_url=invalid_url,
-            )
-        ],
-    )
-
-    with pytest.raises(ValidationError) as exc_info:
-        validate_profile_urls(profile)
-
-    # Verify error message mentions URL validation
-    error = exc_info.value
-    assert error.error_type == "validation"
-    assert "url" in str(error.details).lower()
-
-
-# Feature: linkedin-profile-importer, Property 11: URL validation
-# Validates: Requirements 4.5
-@given(
-    # Generate invalid URLs for certification
-    invalid_url=st.one_of(
-        st.just("ftp://example.com"),
-        st.just("not-a-url"),
-        st.just("http://"),
-        st.text(min_size=1, max_size=20).filter(lambda x: "://" not in x and x.strip()),
-    ),
-)
-def test_invalid_certification_url(invalid_url: str) -> None:
-    """For any invalid URL in certification, validation should fail."""
-    from linkedin_importer.models import Certification
-
-    profile = LinkedInProfile(
-        profile_id="test123",
-        first_name="John",
-        last_name="Doe",
-        email="john@example.com",
-        certifications=[
-            Certification(
-                name="Test Cert",
-                authority="Test Authority",
-                url=invalid_url,
-            )
-        ],
-    )
-
-    with pytest.raises(ValidationError) as exc_info:
-        validate_profile_urls(profile)
-
-    # Verify error message mentions URL validation
-    error = exc_info.value
-    assert error.error_type == "validation"
-    assert "url" in str(error.details).lower()
-
-
-# Feature: linkedin-profile-importer, Property 11: URL validation
-# Validates: Requirements 4.5
-@given(
-    # Generate invalid URLs for publication
-    invalid_url=st.one_of(
-        st.just("ftp://example.com"),
-        st.just("not-a-url"),
-        st.just("http://"),
-        st.text(min_size=1, max_size=20).filter(lambda x: "://" not in x and x.strip()),
-    ),
-)
-def test_invalid_publication_url(invalid_url: str) -> None:
-    """For any invalid URL in publication, validation should fail."""
-    from linkedin_importer.models import Publication
-
-    profile = LinkedInProfile(
-        profile_id="test123",
-        first_name="John",
-        last_name="Doe",
-        email="john@example.com",
-        publications=[
-            Publication(
-                name="Test Publication",
-                url=invalid_url,
-            )
-        ],
-    )
-
-    with pytest.raises(ValidationError) as exc_info:
-        validate_profile_urls(profile)
-
-    # Verify error message mentions URL validation
-    error = exc_info.value
-    assert error.error_type == "validation"
-    assert "url" in str(error.details).lower()
+@pytest.mark.parametrize("location", _URL_LOCATIONS)
+# A small fixed pool: twice its size covers every entry without piling up repeats
+@settings(_VALIDATION_SETTINGS, max_examples=len(_INVALID_URLS) * 2)
+@given(invalid_url=_INVALID_URL)
+def test_invalid_url(location, invalid_url: str) -> None:
+    """For any invalid URL in any URL field, validation should fail."""
+    list_field, _, url_field = location
+    field_path = url_field if list_field is None else f"{list_field}[0].{url_field}"
+    profile = _profile_with_url(*location, invalid_url)
+
+    _assert_field_error(profile, validate_profile_urls, field_path)